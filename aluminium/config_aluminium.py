@@ -32,6 +32,9 @@ run_config = {
     # "MERGE_OUTPUTS"
 }
 RUN_PARALLEL = False
+# Number of processes that create the yearly output tables of a run (1: sequentially). Only used if RUN_PARALLEL is
+#   False, since the runs are already distributed over all cores otherwise
+N_PROCESSES_OUTPUT_YEARS = 1
 APPLY_CARBON_COST = False
 
 ### MODEL DECISION PARAMETERS ###
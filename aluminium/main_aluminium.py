@@ -2,6 +2,7 @@
 
 # Library imports
 import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 
 from aluminium.config_aluminium import RUN_PARALLEL, SECTOR, SENSITIVITIES, run_config
 from aluminium.solver.implicit_forcing import apply_implicit_forcing
@@ -49,12 +50,16 @@ def run_model_parallel(runs):
     """Run model in parallel, faster but harder to debug"""
     n_cores = mp.cpu_count()
     logger.info(f"{n_cores} cores detected")
-    pool = mp.Pool(processes=n_cores - 1)
     logger.info(f"Running model for scenario/sensitivity {runs}")
-    for pathway, sensitivity in runs:
-        pool.apply_async(_run_model, args=(pathway, sensitivity))
-    pool.close()
-    pool.join()
+    # The yearly output tables of each run are then created sequentially (see N_PROCESSES_OUTPUT_YEARS)
+    with ProcessPoolExecutor(max_workers=max(n_cores - 1, 1)) as executor:
+        futures = [
+            executor.submit(_run_model, pathway, sensitivity)
+            for pathway, sensitivity in runs
+        ]
+        # Raise exceptions of failed runs
+        for future in futures:
+            future.result()
 
 
 def main():
@@ -6,6 +6,7 @@ from operator import methodcaller
 import numpy as np
 from aluminium.config_aluminium import LOG_LEVEL, SWITCH_TYPES_UPDATE_YEAR_COMMISSIONED
 from mppshared.agent_logic.agent_logic_functions import (
+    group_assets_by_transition_origin,
     remove_all_transitions_with_destination_technology,
     remove_transition,
     select_best_transition,
@@ -60,6 +61,7 @@ def brownfield(pathway: SimulationPathway, year: int) -> SimulationPathway:
 
         # Find assets can undergo the best transition. If there are no assets for the best transition, continue
         #   searching with the next-best transition
+        candidates_by_origin = group_assets_by_transition_origin(candidates)
         best_candidates = []  # type: ignore
         while not best_candidates:
             # If no more transitions available, break and return pathway
@@ -87,29 +89,18 @@ def brownfield(pathway: SimulationPathway, year: int) -> SimulationPathway:
 
             # Choose the best transition, i.e. highest decommission rank
             best_transition = select_best_transition(df_rank)
+            best_candidates = candidates_by_origin.get(
+                (
+                    best_transition["technology_origin"],
+                    best_transition["region"],
+                    best_transition["product"],
+                ),
+                [],
+            )
             # Check it the transition has PPA on it, if so only get plants that allow transition to ppa
             if "PPA" in best_transition["technology_destination"]:
                 best_candidates = list(
-                    filter(
-                        lambda asset: (
-                            asset.technology == best_transition["technology_origin"]
-                        )
-                        & (asset.region == best_transition["region"])
-                        & (asset.product == best_transition["product"])
-                        & (asset.ppa_allowed == True),
-                        candidates,
-                    )
-                )
-            else:
-                best_candidates = list(
-                    filter(
-                        lambda asset: (
-                            asset.technology == best_transition["technology_origin"]
-                        )
-                        & (asset.region == best_transition["region"])
-                        & (asset.product == best_transition["product"]),
-                        candidates,
-                    )
+                    filter(lambda asset: asset.ppa_allowed == True, best_candidates)
                 )
             new_technology = best_transition["technology_destination"]
             switch_type = best_transition["switch_type"]
@@ -1,14 +1,45 @@
 """ Process outputs to standardised output table."""
 
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 from aluminium.config_aluminium import *
 from mppshared.import_data.intermediate_data import IntermediateDataImporter
 from mppshared.solver.debugging_outputs import create_table_asset_transition_sequences
+from mppshared.utility.dataframe_utility import (
+    categorize_columns,
+    decategorize_columns,
+    get_emission_columns,
+)
 from mppshared.utility.log_utility import get_logger
 
 logger = get_logger(__name__)
 logger.setLevel(LOG_LEVEL)
 
+# Emission scopes and the units and names of their output parameters
+_SCOPES = get_emission_columns(ghgs=GHGS, scopes=EMISSION_SCOPES)
+_MAP_UNIT_EMISSIONS = {
+    f"{ghg}_{scope}": f"Mt {str.upper(ghg)}"
+    for scope in EMISSION_SCOPES
+    for ghg in GHGS
+}
+_MAP_RENAME_EMISSIONS = {
+    f"{ghg}_{scope}": f"{str.upper(ghg)} {str.capitalize(scope).replace('_', ' ')}"
+    for scope in EMISSION_SCOPES
+    for ghg in GHGS
+}
+_MAP_UNIT_INTENSITY = {
+    f"emissions_intensity_{ghg}_{scope}": f"t{str.upper(ghg)}/t"
+    for scope in EMISSION_SCOPES
+    for ghg in GHGS
+}
+_MAP_RENAME_INTENSITY = {
+    f"emissions_intensity_{ghg}_{scope}": f"Emissions intensity {str.upper(ghg)} {str.capitalize(scope).replace('_', ' ')}"
+    for scope in EMISSION_SCOPES
+    for ghg in GHGS
+}
+
 
 def _calculate_number_of_assets(df_stack: pd.DataFrame) -> pd.DataFrame:
     """Calculate number of assets by product, region and technology for a given asset stack"""
@@ -16,15 +47,14 @@ def _calculate_number_of_assets(df_stack: pd.DataFrame) -> pd.DataFrame:
     logger.info("-- Calculating number of assets")
 
     # Count number of assets
-    df_stack["asset"] = 1
+    df_stack = decategorize_columns(df_stack, ["product", "region", "technology"])
     df_stack = (
-        df_stack.groupby(["product", "region", "technology"])
-        .count()["asset"]
-        .reset_index()
+        df_stack.groupby(["product", "region", "technology"], observed=True, sort=False)
+        .size()
+        .reset_index(name="value")
     )
 
     # Add parameter descriptions
-    df_stack.rename(columns={"asset": "value"}, inplace=True)
     df_stack["parameter_group"] = "Production"
     df_stack["parameter"] = "Number of plants"
     df_stack["unit"] = "plant"
@@ -38,9 +68,12 @@ def _calculate_production_volume(df_stack: pd.DataFrame) -> pd.DataFrame:
     logger.info("-- Calculating production volume")
 
     # Sum the annual production volume
+    df_stack = decategorize_columns(df_stack, ["product", "region", "technology"])
     df_stack = (
-        df_stack.groupby(["product", "region", "technology"])
-        .sum()["annual_production_volume"]
+        df_stack.groupby(
+            ["product", "region", "technology"], observed=True, sort=False
+        )["annual_production_volume"]
+        .sum()
         .reset_index()
     )
 
@@ -64,40 +97,33 @@ def _calculate_emissions(
     logger.info("-- Calculating emissions")
 
     # Emissions are the emissions factor multiplied with the annual production volume
-    df_stack = df_stack.merge(df_emissions, on=["product", "region", "technology"])
-    scopes = [f"{ghg}_{scope}" for scope in EMISSION_SCOPES for ghg in GHGS]
+    df_stack = df_stack.join(
+        df_emissions, on=["product", "region", "technology"], how="inner"
+    )
 
-    for scope in scopes:
+    for scope in _SCOPES:
         df_stack[scope] = df_stack[scope] * df_stack["annual_production_volume"]
 
+    df_stack = decategorize_columns(df_stack, agg_vars)
     df_stack = (
-        df_stack.groupby(agg_vars)[scopes + ["annual_production_volume"]]
+        df_stack.groupby(agg_vars, observed=True, sort=False)[
+            _SCOPES + ["annual_production_volume"]
+        ]
         .sum()
         .reset_index()
     )
 
     df_stack = df_stack.melt(
         id_vars=agg_vars,
-        value_vars=scopes,
+        value_vars=_SCOPES,
         var_name="parameter",
         value_name="value",
     )
 
     # Add unit and parameter group
-    map_unit = {
-        f"{ghg}_{scope}": f"Mt {str.upper(ghg)}"
-        for scope in EMISSION_SCOPES
-        for ghg in GHGS
-    }
-    map_rename = {
-        f"{ghg}_{scope}": f"{str.upper(ghg)} {str.capitalize(scope).replace('_', ' ')}"
-        for scope in EMISSION_SCOPES
-        for ghg in GHGS
-    }
-
     df_stack["parameter_group"] = "Emissions"
-    df_stack["unit"] = df_stack["parameter"].apply(lambda x: map_unit[x])
-    df_stack["parameter"] = df_stack["parameter"].replace(map_rename)
+    df_stack["unit"] = df_stack["parameter"].map(_MAP_UNIT_EMISSIONS)
+    df_stack["parameter"] = df_stack["parameter"].map(_MAP_RENAME_EMISSIONS)
     if "technology" not in agg_vars:
         df_stack["technology"] = "All"
 
@@ -114,20 +140,21 @@ def _calculate_co2_captured(
     logger.info("-- Calculating CO2 captured")
 
     # Captured CO2 by technology is calculated by multiplying with the annual production volume
-    df_stack = df_stack.merge(df_emissions, on=["product", "region", "technology"])
+    df_stack = df_stack.join(
+        df_emissions, on=["product", "region", "technology"], how="inner"
+    )
     df_stack["co2_scope1_captured"] = (
         df_stack["co2_scope1_captured"] * df_stack["annual_production_volume"]
     )
 
-    df_stack = df_stack.groupby(agg_vars)["co2_scope1_captured"].sum().reset_index()
-
-    # Melt and add parameter descriptions
-    df_stack = df_stack.melt(
-        id_vars=agg_vars,
-        value_vars="co2_scope1_captured",
-        var_name="parameter",
-        value_name="value",
+    df_stack = decategorize_columns(df_stack, agg_vars)
+    df_stack = (
+        df_stack.groupby(agg_vars, observed=True, sort=False)["co2_scope1_captured"]
+        .sum()
+        .reset_index(name="value")
     )
+
+    # Add parameter descriptions
     df_stack["parameter_group"] = "Emissions"
     df_stack["parameter"] = "CO2 Scope1 captured"
     df_stack["unit"] = "Mt CO2"
@@ -147,56 +174,46 @@ def _calculate_emissions_intensity(
 
     logger.info("-- Calculating emissions intensity")
 
-    # Emission scopes
-    scopes = [f"{ghg}_{scope}" for scope in EMISSION_SCOPES for ghg in GHGS]
-
     # If differentiated by technology, emissions intensity is identical to the emission factors calculated previously (even if zero production)
     if agg_vars == ["product", "region", "technology"]:
-        for scope in scopes:
-            df_stack = df_emissions.rename(
-                {scope: f"emissions_intensity_{scope}" for scope in scopes}, axis=1
-            ).copy()
+        df_stack = df_emissions.reset_index().rename(
+            {scope: f"emissions_intensity_{scope}" for scope in _SCOPES}, axis=1
+        )
 
     # Otherwise, Emissions are the emissions factor multiplied with the annual production volume
     else:
-        df_stack = df_stack.merge(df_emissions, on=["product", "region", "technology"])
-        for scope in scopes:
+        df_stack = df_stack.join(
+            df_emissions, on=["product", "region", "technology"], how="inner"
+        )
+        for scope in _SCOPES:
             df_stack[scope] = df_stack[scope] * df_stack["annual_production_volume"]
 
+        df_stack = decategorize_columns(df_stack, agg_vars)
         df_stack = (
-            df_stack.groupby(agg_vars)[scopes + ["annual_production_volume"]]
+            df_stack.groupby(agg_vars, observed=True, sort=False)[
+                _SCOPES + ["annual_production_volume"]
+            ]
             .sum()
             .reset_index()
         )
 
         # Emissions intensity is the emissions divided by annual production volume
-        for scope in scopes:
+        for scope in _SCOPES:
             df_stack[f"emissions_intensity_{scope}"] = (
                 df_stack[scope] / df_stack["annual_production_volume"]
             )
 
     df_stack = df_stack.melt(
         id_vars=agg_vars,
-        value_vars=[f"emissions_intensity_{scope}" for scope in scopes],
+        value_vars=[f"emissions_intensity_{scope}" for scope in _SCOPES],
         var_name="parameter",
         value_name="value",
     )
 
     # Add unit and parameter group
-    map_unit = {
-        f"emissions_intensity_{ghg}_{scope}": f"t{str.upper(ghg)}/t"
-        for scope in EMISSION_SCOPES
-        for ghg in GHGS
-    }
-    map_rename = {
-        f"emissions_intensity_{ghg}_{scope}": f"Emissions intensity {str.upper(ghg)} {str.capitalize(scope).replace('_', ' ')}"
-        for scope in EMISSION_SCOPES
-        for ghg in GHGS
-    }
-
     df_stack["parameter_group"] = "Emissions intensity"
-    df_stack["unit"] = df_stack["parameter"].apply(lambda x: map_unit[x])
-    df_stack["parameter"] = df_stack["parameter"].replace(map_rename)
+    df_stack["unit"] = df_stack["parameter"].map(_MAP_UNIT_INTENSITY)
+    df_stack["parameter"] = df_stack["parameter"].map(_MAP_RENAME_INTENSITY)
     if "technology" not in agg_vars:
         df_stack["technology"] = "All"
 
@@ -206,26 +223,25 @@ def _calculate_emissions_intensity(
 def _calculate_resource_consumption(
     df_stack: pd.DataFrame,
     df_inputs_outputs: pd.DataFrame,
-    resource: str,
-    year: int,
     agg_vars=["product", "region", "technology"],
 ) -> pd.DataFrame:
-    """Calculate the consumption of a given resource in a given year, optionally grouped by specific variables."""
-
-    logger.info(f"-- Calculating consumption of {resource}")
+    """Calculate the consumption of all resources in the year of df_inputs_outputs, optionally grouped by specific
+    variables."""
 
-    # Get inputs of that resource required for each technology in GJ/t
-    df_variable = df_inputs_outputs.loc[
-        (df_inputs_outputs["parameter"] == resource)
-        & (df_inputs_outputs["year"] == year)
-    ].copy()
+    logger.info("-- Calculating resource consumption")
 
-    df_stack = df_stack.merge(df_variable, on=["product", "region", "technology"])
+    # Get inputs of all resources required for each technology in GJ/t
+    df_stack = df_stack.merge(df_inputs_outputs, on=["product", "region", "technology"])
 
     # Calculate resource consumption in GJ by multiplying the input with the annual production volume of that technology
     df_stack["value"] = df_stack["value"] * df_stack["annual_production_volume"]
+    df_stack = decategorize_columns(
+        df_stack, agg_vars + ["parameter_group", "parameter"]
+    )
     df_stack = (
-        df_stack.groupby(agg_vars + ["parameter_group", "parameter"])["value"].sum()
+        df_stack.groupby(
+            agg_vars + ["parameter_group", "parameter"], observed=True, sort=False
+        )["value"].sum()
     ).reset_index()
 
     # Add unit
@@ -239,7 +255,7 @@ def _calculate_resource_consumption(
         "Lifetime": "Years",
         "CF": "%",
     }
-    df_stack["unit"] = df_stack["parameter_group"].apply(lambda x: unit_map[x])
+    df_stack["unit"] = df_stack["parameter_group"].map(unit_map)
 
     if "technology" not in agg_vars:
         df_stack["technology"] = "All"
@@ -248,18 +264,27 @@ def _calculate_resource_consumption(
 
 
 def create_table_all_data_year(
-    year: int, importer: IntermediateDataImporter
+    year: int,
+    df_stack: pd.DataFrame,
+    df_emissions: pd.DataFrame,
+    df_inputs_outputs: pd.DataFrame,
 ) -> pd.DataFrame:
-    """Create DataFrame with all outputs for a given year."""
+    """Create DataFrame with all outputs for a given year.
+
+    Args:
+        year: year of the asset stack
+        df_stack: asset stack in that year
+        df_emissions: emission factors in that year indexed by product, region and technology
+        df_inputs_outputs: inputs and outputs in that year
+    """
+
+    logger.info(f"Processing year {year}")
 
     # Calculate asset numbers and production volumes for the stack in that year
-    df_stack = importer.get_asset_stack(year)
     df_total_assets = _calculate_number_of_assets(df_stack)
     df_production_capacity = _calculate_production_volume(df_stack)
 
     # Calculate emissions, CO2 captured and emissions intensity
-    df_emissions = importer.get_emissions()
-    df_emissions = df_emissions[df_emissions["year"] == year]
     df_stack_emissions = _calculate_emissions(df_stack, df_emissions)
     df_emissions_intensity = _calculate_emissions_intensity(df_stack, df_emissions)
     df_emissions_intensity_all_tech = _calculate_emissions_intensity(
@@ -268,21 +293,11 @@ def create_table_all_data_year(
     df_co2_captured = _calculate_co2_captured(df_stack, df_emissions)
 
     # Calculate feedstock and energy consumption
-    df_inputs_outputs = importer.get_inputs_outputs()
-    data_variables = []
-
-    for resource in df_inputs_outputs["parameter"].unique():
-        df_stack_variable = _calculate_resource_consumption(
-            df_stack,
-            df_inputs_outputs,
-            resource,
-            year,
-            agg_vars=["product", "region", "technology"],
-        )
-        df_stack_variable["parameter"] = resource
-        data_variables.append(df_stack_variable)
-
-    df_inputs = pd.concat(data_variables)
+    df_inputs = _calculate_resource_consumption(
+        df_stack,
+        df_inputs_outputs,
+        agg_vars=["product", "region", "technology"],
+    )
 
     # Concatenate all the output tables
     df_all_data_year = pd.concat(
@@ -299,9 +314,33 @@ def create_table_all_data_year(
     return df_all_data_year
 
 
+def _sum_by_group(df: pd.DataFrame, group_vars: list, value_var: str) -> pd.DataFrame:
+    """Sum a value column by the groups of group_vars. The groups are encoded as integer codes in order of their
+    first appearance and summed with np.bincount, which skips the overhead of DataFrame.groupby for the many small
+    groups of the investment aggregation.
+
+    Args:
+        df (pd.DataFrame): contains group_vars and value_var
+        group_vars (list): column headers of the group keys
+        value_var (str): column header of the values to sum (NaN counts as zero)
+
+    Returns:
+        pd.DataFrame: one row per group with the columns group_vars and value_var
+    """
+    # Like groupby, drop the rows with a missing group key
+    df = df.dropna(subset=group_vars)
+    codes, groups = pd.MultiIndex.from_frame(df[group_vars]).factorize()
+    values = np.bincount(
+        codes,
+        weights=np.nan_to_num(df[value_var].to_numpy(dtype=float)),
+        minlength=len(groups),
+    )
+    return groups.to_frame(index=False, name=group_vars).assign(**{value_var: values})
+
+
 def _calculate_annual_investments(
     df_cost: pd.DataFrame,
-    importer: IntermediateDataImporter,
+    stacks: dict,
     sector: str,
     agg_vars=["product", "region", "switch_type", "technology_destination"],
 ) -> pd.DataFrame:
@@ -309,100 +348,82 @@ def _calculate_annual_investments(
 
     # Calculate invesment in newbuild, brownfield retrofit and brownfield rebuild technologies in every year
     switch_types = ["greenfield", "rebuild", "retrofit"]
-    df_investment = pd.DataFrame()
-
-    for year in np.arange(START_YEAR + 1, END_YEAR + 1):
-
-        # Get current and previous stack
-        drop_cols = ["annual_production_volume", "cuf", "asset_lifetime"]
-        current_stack = (
-            importer.get_asset_stack(year)
-            .drop(columns=drop_cols)
-            .rename(
-                {
-                    "technology": "technology_destination",
-                    "annual_production_capacity": "annual_production_capacity_destination",
-                },
-                axis=1,
-            )
-        )
-        previous_stack = (
-            importer.get_asset_stack(year - 1)
-            .drop(columns=drop_cols)
-            .rename(
-                {
-                    "technology": "technology_origin",
-                    "annual_production_capacity": "annual_production_capacity_origin",
-                },
-                axis=1,
-            )
-        )
 
-        # Merge to compare retrofit, rebuild and greenfield status
-        previous_stack = previous_stack.rename(
-            {
-                f"{switch_type}_status": f"previous_{switch_type}_status"
-                for switch_type in switch_types
-            },
-            axis=1,
-        )
-        df = current_stack.merge(
-            previous_stack.drop(columns=["product", "region"]), on="uuid", how="left"
-        )
-
-        # Identify newly built assets
-        df.loc[
-            (df["greenfield_status"] == True)
-            & (df["previous_greenfield_status"].isna()),
-            ["switch_type", "technology_origin"],
-        ] = ["greenfield", "New-build"]
+    # Combine the stacks of all years into one table
+    drop_cols = ["annual_production_volume", "cuf", "asset_lifetime"]
+    df_stacks = pd.concat(
+        [
+            stacks[year].drop(columns=drop_cols).assign(year=year)
+            for year in range(START_YEAR, END_YEAR + 1)
+        ],
+        ignore_index=True,
+    )
 
-        # Identify retrofit assets
-        df.loc[
-            (df["retrofit_status"] == True) & (df["previous_retrofit_status"] == False),
-            "switch_type",
-        ] = "brownfield_renovation"
+    # Current stack of every year (except the first) and previous stack shifted by one year
+    current_stack = df_stacks.loc[df_stacks["year"] > START_YEAR].rename(
+        {
+            "technology": "technology_destination",
+            "annual_production_capacity": "annual_production_capacity_destination",
+        },
+        axis=1,
+    )
+    previous_stack = df_stacks[
+        ["uuid", "year", "technology"]
+        + [f"{switch_type}_status" for switch_type in switch_types]
+    ].rename(
+        {"technology": "technology_origin"}
+        | {
+            f"{switch_type}_status": f"previous_{switch_type}_status"
+            for switch_type in switch_types
+        },
+        axis=1,
+    )
+    previous_stack["year"] += 1
+    # The origin of newly built assets is set to "New-build" below, which is not a technology category
+    previous_stack = decategorize_columns(previous_stack, ["technology_origin"])
 
-        # Identify rebuild assets
-        df.loc[
-            (df["rebuild_status"] == True) & (df["previous_rebuild_status"] == False),
-            "switch_type",
-        ] = "brownfield_newbuild"
-
-        # Drop all assets that haven't undergone a transition
-        df = df.loc[df["switch_type"].notna()]
-        df["year"] = year
-
-        # Add the corresponding switching CAPEX to every asset that has changed
-        df = df.merge(
-            df_cost,
-            on=[
-                "product",
-                "region",
-                "year",
-                "technology_origin",
-                "technology_destination",
-                "switch_type",
-            ],
-            how="left",
-        )
+    # Merge to compare retrofit, rebuild and greenfield status
+    df = current_stack.merge(previous_stack, on=["uuid", "year"], how="left")
 
-        # Calculate investment cost per changed asset by multiplying CAPEX (in USD/tpa) with production capacity (in Mtpa) and sum
-        df["investment"] = (
-            df["switch_capex"] * df["annual_production_capacity_destination"] * 1e6
-        )
-        df = df.groupby(agg_vars)[["investment"]].sum().reset_index(drop=False)
+    # Identify newly built, retrofit and rebuild assets (later conditions take precedence)
+    greenfield = (df["greenfield_status"] == True) & (
+        df["previous_greenfield_status"].isna()
+    )
+    retrofit = (df["retrofit_status"] == True) & (
+        df["previous_retrofit_status"] == False
+    )
+    rebuild = (df["rebuild_status"] == True) & (df["previous_rebuild_status"] == False)
+    df["switch_type"] = np.select(
+        [rebuild, retrofit, greenfield],
+        ["brownfield_newbuild", "brownfield_renovation", "greenfield"],
+        default="",
+    )
+    df["technology_origin"] = df["technology_origin"].where(~greenfield, "New-build")
 
-        df = df.melt(
-            id_vars=agg_vars,
-            value_vars="investment",
-            var_name="parameter",
-            value_name="value",
-        )
+    # Drop all assets that haven't undergone a transition
+    df = df.loc[df["switch_type"] != ""]
 
-        df["year"] = year
+    # Add the corresponding switching CAPEX to every asset that has changed
+    df = df.merge(
+        df_cost,
+        on=[
+            "product",
+            "region",
+            "year",
+            "technology_origin",
+            "technology_destination",
+            "switch_type",
+        ],
+        how="left",
+    )
 
-        df_investment = pd.concat([df_investment, df])
+    # Calculate investment cost per changed asset by multiplying CAPEX (in USD/tpa) with production capacity (in Mtpa) and sum
+    df["investment"] = (
+        df["switch_capex"] * df["annual_production_capacity_destination"] * 1e6
+    )
+    df = decategorize_columns(df, agg_vars)
+    df = _sum_by_group(df, group_vars=agg_vars + ["year"], value_var="investment")
+    df_investment = df.rename(columns={"investment": "value"})
 
     for variable in ["product", "region", "switch_type", "technology_destination"]:
         if variable not in agg_vars:
@@ -414,8 +435,8 @@ def _calculate_annual_investments(
             "brownfield_newbuild": "Brownfield rebuild investment",
             "greenfield": "Greenfield investment",
         }
-        df_investment["parameter"] = df_investment["switch_type"].apply(
-            lambda x: map_parameter_group[x]
+        df_investment["parameter"] = df_investment["switch_type"].map(
+            map_parameter_group
         )
     else:
         df_investment[
@@ -446,9 +467,63 @@ def _calculate_annual_investments(
     return df_pivot
 
 
+def _calculate_lcox_weights(df_cost: pd.DataFrame, stacks: dict) -> pd.DataFrame:
+    """Calculate the sum of weighted LCOX and the sum of weights by product, region, technology and year. The
+    weighted average LCOX of any coarser aggregation is the ratio of these sums summed over that aggregation.
+
+    Args:
+        df_cost (pd.DataFrame): contains LCOX by product, region, technology_destination and year
+        stacks (dict): asset stacks by year
+
+    Returns:
+        pd.DataFrame: contains the columns weighted_lcox and weight by product, region, technology and year
+    """
+
+    # Combine the stacks of all years, the LCOX of an asset is based on the year it was commissioned
+    df_stacks = pd.concat(
+        [
+            stacks[year][
+                ["product", "region", "technology", "year_commissioned"]
+                + ["annual_production_volume"]
+            ].assign(model_year=year)
+            for year in range(START_YEAR, END_YEAR + 1)
+        ],
+        ignore_index=True,
+    ).rename(columns={"year_commissioned": "year"})
+
+    # Assume that assets built before start of model time horizon have LCOX of start year
+    df_stacks["year"] = df_stacks["year"].clip(lower=START_YEAR)
+
+    # Add LCOX to each asset
+    df_cost = df_cost.loc[df_cost["technology_origin"] == "New-build"]
+    df_cost = df_cost.rename(columns={"technology_destination": "technology"})
+    df_stacks = df_stacks.merge(
+        df_cost[["product", "region", "technology", "year", "lcox"]],
+        on=["product", "region", "technology", "year"],
+        how="left",
+    )
+
+    # Assets without LCOX are excluded from both sums
+    df_stacks["weight"] = (df_stacks["annual_production_volume"] + 1).where(
+        df_stacks["lcox"].notna()
+    )
+    df_stacks["weighted_lcox"] = (df_stacks["lcox"] + 1) * df_stacks["weight"]
+    df_stacks = decategorize_columns(df_stacks, ["product", "region", "technology"])
+    df_lcox_weights = (
+        df_stacks.groupby(
+            ["product", "region", "technology", "model_year"], observed=True, sort=False
+        )[["weighted_lcox", "weight"]]
+        .sum()
+        .reset_index(drop=False)
+        .rename(columns={"model_year": "year"})
+    )
+
+    return df_lcox_weights
+
+
 def calculate_weighted_average_lcox(
     df_cost: pd.DataFrame,
-    importer: IntermediateDataImporter,
+    df_lcox_weights: pd.DataFrame,
     sector: str,
     agg_vars=["product", "region", "technology"],
 ) -> pd.DataFrame:
@@ -458,44 +533,17 @@ def calculate_weighted_average_lcox(
     if agg_vars == ["product", "region", "technology"]:
         df = df_cost.rename(
             {"lcox": "value", "technology_destination": "technology"}, axis=1
-        ).copy()
+        )
         df = df.loc[df["technology_origin"] == "New-build"]
 
     else:
-        df = pd.DataFrame()
-        # In every year, get LCOX of the asset based on the year it was commissioned and average according to desired aggregation
-        for year in np.arange(START_YEAR, END_YEAR + 1):
-            df_stack = importer.get_asset_stack(year)
-            df_stack = df_stack.rename(columns={"year_commissioned": "year"})
-
-            # Assume that assets built before start of model time horizon have LCOX of start year
-            df_stack.loc[df_stack["year"] < START_YEAR, "year"] = START_YEAR
-
-            # Add LCOX to each asset
-            df_cost = df_cost.loc[df_cost["technology_origin"] == "New-build"]
-            df_cost = df_cost.rename(columns={"technology_destination": "technology"})
-            df_stack = df_stack.merge(
-                df_cost, on=["product", "region", "technology", "year"], how="left"
-            )
-
-            # Calculate weighted average according to desired aggregation
-            df_stack = (
-                df_stack.groupby(agg_vars).apply(
-                    lambda x: np.average(
-                        x["lcox"] + 1, weights=x["annual_production_volume"] + 1
-                    )
-                )
-            ).reset_index(drop=False)
-
-            df_stack = df_stack.melt(
-                id_vars=agg_vars,
-                value_vars="lcox",
-                var_name="parameter",
-                value_name="value",
-            )
-            df_stack["year"] = year
-
-            df = pd.concat([df, df_stack])
+        # Calculate weighted average according to desired aggregation as the ratio of the sum of weighted LCOX and
+        #   the sum of weights in every year
+        df = df_lcox_weights.groupby(agg_vars + ["year"], observed=True, sort=False)[
+            ["weighted_lcox", "weight"]
+        ].sum()
+        df["value"] = df["weighted_lcox"] / df["weight"]
+        df = df.reset_index(drop=False)[agg_vars + ["year", "value"]]
 
     # Transform to output table format
     df["parameter_group"] = "Cost"
@@ -535,40 +583,58 @@ def calculate_outputs(pathway_name: str, sensitivity: str, sector: str):
         products=PRODUCTS,
     )
 
+    # Load the asset stacks, emissions and inputs once and reuse them for all outputs
+    stacks = {
+        year: importer.get_asset_stack(year) for year in range(START_YEAR, END_YEAR + 1)
+    }
+
     # Create summary table of asset transitions
     logger.info("Creating table with asset transition sequences.")
     df_transitions = create_table_asset_transition_sequences(
-        importer, START_YEAR, END_YEAR
+        importer, START_YEAR, END_YEAR, stacks=stacks
     )
     importer.export_data(
         df_transitions,
         f"asset_transition_sequences_sensitivity_{sensitivity}.csv",
         "final",
     )
+
+    # Store the string keys of the stacks as categoricals with the same categories in every year
+    stacks = categorize_columns(
+        stacks, ["product", "region", "technology", "technology_classification"]
+    )
+    df_emissions = importer.get_emissions()
+    emissions_by_year = {
+        year: df.drop(columns="year").set_index(["product", "region", "technology"])
+        for year, df in df_emissions.groupby("year")
+    }
+    df_inputs_outputs = importer.get_inputs_outputs()
+
     # Calculate weighted average of LCOX
     df_cost = importer.get_technology_transitions_and_cost()
+    df_lcox_weights = _calculate_lcox_weights(df_cost=df_cost, stacks=stacks)
     df_lcox = calculate_weighted_average_lcox(
         df_cost=df_cost,
-        importer=importer,
+        df_lcox_weights=df_lcox_weights,
         sector=sector,
         agg_vars=["product", "region", "technology"],
     )
     df_lcox_all_techs = calculate_weighted_average_lcox(
         df_cost=df_cost,
-        importer=importer,
+        df_lcox_weights=df_lcox_weights,
         sector=sector,
         agg_vars=["product", "region"],
     )
     df_lcox_all_regions_all_techs = calculate_weighted_average_lcox(
         df_cost=df_cost,
-        importer=importer,
+        df_lcox_weights=df_lcox_weights,
         sector=sector,
         agg_vars=["product"],
     )
 
     df_lcox_all_regions = calculate_weighted_average_lcox(
         df_cost=df_cost,
-        importer=importer,
+        df_lcox_weights=df_lcox_weights,
         sector=sector,
         agg_vars=["product", "technology"],
     )
@@ -576,41 +642,48 @@ def calculate_outputs(pathway_name: str, sensitivity: str, sector: str):
     # Calculate annual investments
     df_annual_investments = _calculate_annual_investments(
         df_cost=df_cost,
-        importer=importer,
+        stacks=stacks,
         sector=sector,
         agg_vars=["product", "region", "switch_type", "technology_destination"],
     )
     df_annual_investments_all_tech = _calculate_annual_investments(
         df_cost=df_cost,
-        importer=importer,
+        stacks=stacks,
         sector=sector,
         agg_vars=["product", "region", "switch_type"],
     )
     df_annual_investments_all_switch_types = _calculate_annual_investments(
         df_cost=df_cost,
-        importer=importer,
+        stacks=stacks,
         sector=sector,
         agg_vars=["product", "region", "technology_destination"],
     )
     df_annual_investments_all_tech_all_switch_types = _calculate_annual_investments(
         df_cost=df_cost,
-        importer=importer,
+        stacks=stacks,
         sector=sector,
         agg_vars=["product", "region"],
     )
 
-    # Create output table for every year and concatenate
-    data = []
-    data_stacks = []
+    # Create output table for every year (in parallel processes if enabled and the runs themselves are not run in
+    #   parallel) and concatenate
+    years = list(range(START_YEAR, END_YEAR + 1))
+    args = (
+        years,
+        [stacks[year] for year in years],
+        [emissions_by_year[year] for year in years],
+        [df_inputs_outputs.loc[df_inputs_outputs["year"] == year] for year in years],
+    )
+    if N_PROCESSES_OUTPUT_YEARS > 1 and not RUN_PARALLEL:
+        with ProcessPoolExecutor(max_workers=N_PROCESSES_OUTPUT_YEARS) as executor:
+            data = list(executor.map(create_table_all_data_year, *args))
+    else:
+        data = list(map(create_table_all_data_year, *args))
 
-    for year in range(START_YEAR, END_YEAR + 1):
-        logger.info(f"Processing year {year}")
-        yearly = create_table_all_data_year(year, importer)
+    data_stacks = []
+    for year, yearly in zip(years, data):
         yearly["year"] = year
-        data.append(yearly)
-        df_stack = importer.get_asset_stack(year)
-        df_stack["year"] = year
-        data_stacks.append(df_stack)
+        data_stacks.append(stacks[year].assign(year=year))
 
     df_stacks = pd.concat(data_stacks)
     df = pd.concat(data)
@@ -652,7 +725,11 @@ def calculate_outputs(pathway_name: str, sensitivity: str, sector: str):
     importer.export_data(
         df_pivot, f"simulation_outputs_{suffix}.csv", "final", index=False
     )
-    df_pivot.to_csv(f"{OUTPUT_WRITE_PATH}/simulation_outputs_{suffix}.csv", index=False)
+    # Copy the exported file instead of serializing the wide table to CSV a second time
+    shutil.copyfile(
+        src=importer.final_path.joinpath(f"simulation_outputs_{suffix}.csv"),
+        dst=f"{OUTPUT_WRITE_PATH}/simulation_outputs_{suffix}.csv",
+    )
 
     columns = [
         "sector",
@@ -675,34 +752,43 @@ def calculate_outputs(pathway_name: str, sensitivity: str, sector: str):
 
 
 def save_consolidated_outputs(sector: str):
-    data = []
     runs = []
     for pathway, sensitivities in SENSITIVITIES.items():
         for sensitivity in sensitivities:
             runs.append((pathway, sensitivity))
-    # for pathway, sensitivity in itertools.product(PATHWAYS, SENSITIVITIES):
-    for pathway, sensitivity in runs:
-        df_ = pd.read_csv(
-            f"../mpp-shared-code/data/{SECTOR}/{pathway}/{sensitivity}/final/simulation_outputs_{SECTOR}_{pathway}_{sensitivity}.csv"
-        )
-        df_["pathway"] = pathway
-        df_["sensitivity"] = sensitivity
-        data.append(df_)
-    df = pd.concat(data)
-    columns = [
+    year_columns = [str(i) for i in range(START_YEAR, END_YEAR + 1)]
+    index_columns = [
         "sector",
         "product",
-        "pathway",
-        "sensitivity",
         "region",
         "technology",
         "parameter_group",
         "parameter",
         "unit",
-    ] + [str(i) for i in range(START_YEAR, END_YEAR + 1)]
+    ]
+    # Only parse the columns that end up in the consolidated outputs
+    data = [
+        pd.read_csv(
+            f"../mpp-shared-code/data/{SECTOR}/{pathway}/{sensitivity}/final/simulation_outputs_{SECTOR}_{pathway}_{sensitivity}.csv",
+            usecols=index_columns + year_columns,
+        )
+        for pathway, sensitivity in runs
+    ]
+    # Label the rows of each run with one concat instead of adding columns to every DataFrame
+    df = pd.concat(data, keys=runs, names=["pathway", "sensitivity", None])
+    df = df.reset_index(level=["pathway", "sensitivity"])
+    columns = (
+        index_columns[:2]
+        + ["pathway", "sensitivity"]
+        + index_columns[2:]
+        + year_columns
+    )
     df = df[columns]
     df.to_csv(
         f"{OUTPUT_WRITE_PATH}/simulation_outputs_{SECTOR}_consolidated.csv",
         index=False,
     )
-    df.to_csv(f"data/{sector}/simulation_outputs_{SECTOR}_consolidated.csv")
+    shutil.copyfile(
+        src=f"{OUTPUT_WRITE_PATH}/simulation_outputs_{SECTOR}_consolidated.csv",
+        dst=f"data/{sector}/simulation_outputs_{SECTOR}_consolidated.csv",
+    )
@@ -61,9 +61,6 @@ def simulate(pathway: SimulationPathway) -> SimulationPathway:
         # Copy over last year's stack to this year
         pathway = pathway.copy_stack(year=year)
 
-        # Write stack to csv
-        pathway.export_stack_to_csv(year)
-
         # Decommission assets
         start = timer()
         pathway = decommission(pathway=pathway, year=year)
@@ -88,6 +85,11 @@ def simulate(pathway: SimulationPathway) -> SimulationPathway:
             f"Time elapsed for greenfield in year {year}: {timedelta(seconds=end-start)} seconds"
         )
 
+    # Write stacks to csv after the simulation, the stack of a year does not change anymore once it has been copied
+    #   to the next year
+    for year in range(START_YEAR, END_YEAR + 1):
+        pathway.export_stack_to_csv(year)
+
     return pathway
 
 
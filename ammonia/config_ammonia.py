@@ -2,6 +2,7 @@
 import logging
 
 import numpy as np
+import pandas as pd
 
 ### RUN CONFIGURATION ###
 LOG_LEVEL = "DEBUG"
@@ -21,6 +22,15 @@ run_config = {
     "CALCULATE_OUTPUTS",
     "CALCULATE_DEBUGGING_OUTPUTS",
 }  # comment lines to adjust run configuration
+# Outputs created in the CALCULATE_DEBUGGING_OUTPUTS step
+DEBUG_OUTPUTS = {
+    # "transitions",
+    # "rebuild",
+    # "retrofit",
+    # "newbuild",
+    "emissions",
+    "roadmap",
+}  # comment lines to adjust debugging outputs
 
 ### OVERARCHING MODEL PARAMETERS ###
 SECTOR = "ammonia"
@@ -449,6 +459,11 @@ REGIONS = [
     "Saudi Arabia",
 ]
 
+# Categorical dtypes for the product and region columns of the ammonia tables, shared so that all tables have
+# identical categories and filters compare integer codes instead of strings
+PRODUCT_DTYPE = pd.CategoricalDtype(categories=PRODUCTS)
+REGION_DTYPE = pd.CategoricalDtype(categories=REGIONS + ["Global"])
+
 # Maximum share of global demand that can be supplied by one region
 MAXIMUM_GLOBAL_DEMAND_SHARE_ONE_REGION = 0.3
 
@@ -458,39 +473,8 @@ TECHNOLOGIES_MAXIMUM_GLOBAL_DEMAND_SHARE = [
     "Biomass Digestion + ammonia synthesis",
     "Methane Pyrolysis + ammonia synthesis",
 ]
-MAXIMUM_GLOBAL_DEMAND_SHARE = {
-    2020: 0.02,
-    2021: 0.02,
-    2022: 0.02,
-    2023: 0.02,
-    2024: 0.02,
-    2025: 0.02,
-    2026: 0.02,
-    2027: 0.02,
-    2028: 0.02,
-    2029: 0.02,
-    2030: 0.02,
-    2031: 0.02,
-    2032: 0.02,
-    2033: 0.02,
-    2034: 0.02,
-    2035: 0.02,
-    2036: 0.02,
-    2037: 0.02,
-    2038: 0.02,
-    2039: 0.02,
-    2040: 0.02,
-    2041: 1,
-    2042: 1,
-    2043: 1,
-    2044: 1,
-    2045: 1,
-    2046: 1,
-    2047: 1,
-    2048: 1,
-    2049: 1,
-    2050: 1,
-}
+# Maximum global demand share in each year of MODEL_YEARS (index with year - START_YEAR)
+MAXIMUM_GLOBAL_DEMAND_SHARE = np.where(MODEL_YEARS <= 2040, 0.02, 1.0)
 
 # Year from which newbuild capacity must have transition or end-state technology
 TECHNOLOGY_MORATORIUM = 2050
@@ -520,6 +504,9 @@ ANNUAL_RENOVATION_SHARE = 0.05
 # Increase in cost metric required to enact a brownfield renovation or brownfield rebuild transition
 COST_METRIC_DECREASE_BROWNFIELD = 0.05
 
+# Seed to choose between brownfield transitions and assets with the same rank, combined with the year (None: random)
+BROWNFIELD_RANDOM_SEED = None
+
 # Regional ban of technologies (sector-specific)
 REGIONAL_TECHNOLOGY_BAN = {
     "China": [
@@ -1,15 +1,21 @@
 """Execute the MPP Ammonia model."""
 
 # Import external libraries
+import importlib
 import itertools
 import multiprocessing as mp
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
 
 # Imports from sector-specific code
 from ammonia.config_ammonia import (
     CARBON_COSTS,
-    END_YEAR,
     END_YEAR_MAP,
     LOG_LEVEL,
     MODEL_YEARS,
@@ -19,14 +25,6 @@ from ammonia.config_ammonia import (
     SENSITIVITIES,
     run_config,
 )
-from ammonia.output.debugging_outputs import create_debugging_outputs
-from ammonia.output.output_processing import calculate_outputs
-from ammonia.preprocess.calculate import calculate_variables
-from ammonia.preprocess.create_solver_input import create_solver_input_tables
-from ammonia.preprocess.import_data import import_all
-from ammonia.solver.implicit_forcing import apply_implicit_forcing
-from ammonia.solver.ranking import make_rankings
-from ammonia.solver.simulate import simulate_pathway
 
 # Imports from mppshared
 from mppshared.models.carbon_cost_trajectory import CarbonCostTrajectory
@@ -37,27 +35,64 @@ logger = get_logger(__name__)
 logger.setLevel(LOG_LEVEL)
 
 
+# Module and name of the function of each step, imported only when the step is run
 funcs = {
     # These steps can only be run sequentially (run_parallel = False)
-    "IMPORT_DATA": import_all,
-    "CALCULATE_VARIABLES": calculate_variables,
-    "SOLVER_INPUT": create_solver_input_tables,
+    "IMPORT_DATA": ("ammonia.preprocess.import_data", "import_all"),
+    "CALCULATE_VARIABLES": ("ammonia.preprocess.calculate", "calculate_variables"),
+    "SOLVER_INPUT": (
+        "ammonia.preprocess.create_solver_input",
+        "create_solver_input_tables",
+    ),
     # These steps can optionally be run in parallel (run_parallel = True)
-    "APPLY_IMPLICIT_FORCING": apply_implicit_forcing,
-    "MAKE_RANKINGS": make_rankings,
-    "SIMULATE_PATHWAY": simulate_pathway,
-    "CALCULATE_OUTPUTS": calculate_outputs,
-    # "CALCULATE_DEBUGGING_OUTPUTS": create_debugging_outputs,
+    "APPLY_IMPLICIT_FORCING": (
+        "ammonia.solver.implicit_forcing",
+        "apply_implicit_forcing",
+    ),
+    "MAKE_RANKINGS": ("ammonia.solver.ranking", "make_rankings"),
+    "SIMULATE_PATHWAY": ("ammonia.solver.simulate", "simulate_pathway"),
+    "CALCULATE_OUTPUTS": ("ammonia.output.output_processing", "calculate_outputs"),
+    # "CALCULATE_DEBUGGING_OUTPUTS": (
+    #     "ammonia.output.debugging_outputs",
+    #     "create_debugging_outputs",
+    # ),
 }
+_loaded_funcs = {}
+
+
+def _get_func(name: str):
+    """Import the function of a step on first use"""
+    if name not in _loaded_funcs:
+        module, func_name = funcs[name]
+        _loaded_funcs[name] = getattr(importlib.import_module(module), func_name)
+    return _loaded_funcs[name]
+
+
+# Steps that do not depend on the carbon cost and are run only once for every pathway and sensitivity
+shared_funcs = ["IMPORT_DATA", "CALCULATE_VARIABLES", "SOLVER_INPUT"]
+
+
+def _run_shared_steps(pathway, sensitivity):
+    for name in funcs:
+        if (name in run_config) & (name in shared_funcs):
+            logger.info(
+                f"Running pathway {pathway} sensitivity {sensitivity} section {name}"
+            )
+            _get_func(name)(
+                pathway_name=pathway,
+                sensitivity=sensitivity,
+                sector=SECTOR,
+                carbon_cost_trajectory=None,
+            )
 
 
 def _run_model(pathway, sensitivity, carbon_cost):
-    for name, func in funcs.items():
-        if name in run_config:
+    for name in funcs:
+        if (name in run_config) & (name not in shared_funcs):
             logger.info(
                 f"Running pathway {pathway} sensitivity {sensitivity} section {name}"
             )
-            func(
+            _get_func(name)(
                 pathway_name=pathway,
                 sensitivity=sensitivity,
                 sector=SECTOR,
@@ -65,48 +100,78 @@ def _run_model(pathway, sensitivity, carbon_cost):
             )
 
 
+# ioctl request that clones a file on copy-on-write filesystems (e.g., Btrfs, XFS) in constant time
+FICLONE = 0x40049409
+
+
+def _copy_file(src: str, dst: str):
+    """Copy a file as a copy-on-write clone where the filesystem supports it, otherwise copy its contents"""
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+def _copy_folder(source_dir: str, target_dir: str):
+    """Copy a folder, copying its files concurrently since this is I/O-bound"""
+    with ThreadPoolExecutor() as executor:
+        futures = []
+        shutil.copytree(
+            source_dir,
+            target_dir,
+            dirs_exist_ok=True,
+            copy_function=lambda src, dst: futures.append(
+                executor.submit(_copy_file, src, dst)
+            ),
+        )
+        # Raise exceptions of failed copies
+        for future in futures:
+            future.result()
+
+
+def _prepare_run_folders(pathway, sensitivity, carbon_cost):
+    """Create the folders of a run with a carbon cost and copy the intermediate data of pathway and sensitivity"""
+    if "APPLY_IMPLICIT_FORCING" in funcs:
+        # Copy intermediate folder to right carbon cost directory
+        cc = carbon_cost.final_carbon_cost
+        for folder in ["final", "intermediate", "ranking", "stack_tracker"]:
+            final_folder = (
+                f"{SECTOR}/data/{pathway}/{sensitivity}/carbon_cost_{int(cc)}/{folder}"
+            )
+            os.makedirs(final_folder, exist_ok=True)
+            if folder == "intermediate":
+                source_dir = f"{SECTOR}/data/{pathway}/{sensitivity}/{folder}"
+                _copy_folder(source_dir, final_folder)
+
+
 def run_model_sequential(runs):
     """Run model sequentially, slower but better for debugging"""
     for pathway, sensitivity, carbon_cost in runs:
-        if "APPLY_IMPLICIT_FORCING" in funcs:
-            # Copy intermediate folder to right carbon cost directory
-            cc = carbon_cost.df_carbon_cost.loc[
-                carbon_cost.df_carbon_cost["year"] == END_YEAR, "carbon_cost"
-            ].item()
-            for folder in ["final", "intermediate", "ranking", "stack_tracker"]:
-                final_folder = f"{SECTOR}/data/{pathway}/{sensitivity}/carbon_cost_{int(cc)}/{folder}"
-                if not os.path.exists(final_folder):
-                    os.makedirs(final_folder)
-                if folder == "intermediate":
-                    source_dir = f"{SECTOR}/data/{pathway}/{sensitivity}/{folder}"
-                    shutil.copytree(source_dir, final_folder, dirs_exist_ok=True)
+        _prepare_run_folders(pathway, sensitivity, carbon_cost)
         _run_model(pathway=pathway, sensitivity=sensitivity, carbon_cost=carbon_cost)
 
 
-def run_model_parallel(runs):
+def run_model_parallel(runs, n_runs):
     """Run model in parallel, faster but harder to debug"""
     n_cores = mp.cpu_count()
     logger.info(f"{n_cores} cores detected")
-    pool = mp.Pool(processes=n_cores)
-    logger.info(f"Running model for scenario/sensitivity {runs}")
-    for pathway, sensitivity, carbon_cost in runs:
-        if "APPLY_IMPLICIT_FORCING" in funcs:
-            # Copy intermediate folder to right carbon cost directory
-            cc = carbon_cost.df_carbon_cost.loc[
-                carbon_cost.df_carbon_cost["year"] == END_YEAR, "carbon_cost"
-            ].item()
-            for folder in ["final", "intermediate", "ranking", "stack_tracker"]:
-                final_folder = (
-                    f"{SECTOR}/data/{pathway}/{sensitivity}/carbon_cost_{cc}/{folder}"
-                )
-                if not os.path.exists(final_folder):
-                    os.makedirs(final_folder)
-                if folder == "intermediate":
-                    source_dir = f"{SECTOR}/data/{pathway}/{sensitivity}/{folder}"
-                    shutil.copytree(source_dir, final_folder, dirs_exist_ok=True)
-        pool.apply_async(_run_model, args=(pathway, sensitivity, carbon_cost))
-    pool.close()
-    pool.join()
+    logger.info(f"Running model for {n_runs} scenario/sensitivity/carbon cost runs")
+    # No more worker processes than runs
+    with ProcessPoolExecutor(max_workers=max(min(n_runs, n_cores), 1)) as executor:
+        futures = []
+        for pathway, sensitivity, carbon_cost in runs:
+            _prepare_run_folders(pathway, sensitivity, carbon_cost)
+            futures.append(
+                executor.submit(_run_model, pathway, sensitivity, carbon_cost)
+            )
+        # Raise exceptions of failed runs as soon as they occur
+        for future in as_completed(futures):
+            future.result()
 
 
 def main():
@@ -127,10 +192,15 @@ def main():
             )
         )
 
-    # Execute the model runs
-    runs = list(itertools.product(PATHWAYS, SENSITIVITIES, carbon_cost_trajectories))
+    # Run the steps shared by all carbon costs once, they can only be run sequentially
+    for pathway, sensitivity in itertools.product(PATHWAYS, SENSITIVITIES):
+        _run_shared_steps(pathway=pathway, sensitivity=sensitivity)
+
+    # Execute the model runs for every carbon cost, the runs are generated as they are submitted
+    runs = itertools.product(PATHWAYS, SENSITIVITIES, carbon_cost_trajectories)
     if RUN_PARALLEL:
-        run_model_parallel(runs)
+        n_runs = len(PATHWAYS) * len(SENSITIVITIES) * len(carbon_cost_trajectories)
+        run_model_parallel(runs, n_runs=n_runs)
     else:
         run_model_sequential(runs)
 
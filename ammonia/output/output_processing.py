@@ -319,13 +319,13 @@ def _calculate_number_of_assets(
             .sum()["annual_production_volume"]
             .reset_index()
         )
-        df_stack["asset"] = df_stack[["product", "annual_production_volume"]].apply(
-            lambda x: int(
-                x[1]
-                / (CUF_UPPER_THRESHOLD * ASSUMED_ANNUAL_PRODUCTION_CAPACITY_MT[x[0]])
-            ),
-            axis=1,
-        )
+        df_stack["asset"] = (
+            df_stack["annual_production_volume"]
+            / (
+                CUF_UPPER_THRESHOLD
+                * df_stack["product"].map(ASSUMED_ANNUAL_PRODUCTION_CAPACITY_MT)
+            )
+        ).astype(int)
         df_stack["parameter"] = "Number of plants (standard CUF)"
         df_stack = df_stack.drop(columns=["annual_production_volume"])
     else:
@@ -1100,18 +1100,13 @@ def _calculate_plant_numbers_by_type(
                 .reset_index(drop=False)
             )
 
-            df["plant_number"] = df[
-                ["product", "annual_production_volume_destination"]
-            ].apply(
-                lambda x: int(
-                    x[1]
-                    / (
-                        ASSUMED_ANNUAL_PRODUCTION_CAPACITY_MT[x[0]]
-                        * CUF_UPPER_THRESHOLD
-                    )
-                ),
-                axis=1,
-            )
+            df["plant_number"] = (
+                df["annual_production_volume_destination"]
+                / (
+                    df["product"].map(ASSUMED_ANNUAL_PRODUCTION_CAPACITY_MT)
+                    * CUF_UPPER_THRESHOLD
+                )
+            ).astype(int)
 
         else:
             df["plant_number"] = 1
@@ -1179,12 +1174,7 @@ def calculate_weighted_average_cost_metric(
 ) -> pd.DataFrame:
     """Calculate weighted average of LCOX across the supply mix in a given year."""
     cost_metrics = ["lcox", "annualized_cost", "marginal_cost"]
-    if (
-        carbon_cost.df_carbon_cost.loc[
-            carbon_cost.df_carbon_cost["year"] == 2050, "carbon_cost"
-        ].item()
-        > 0
-    ):
+    if carbon_cost.get_carbon_cost(2050) > 0:
         # Add carbon cost to cost DataFrame
         df_carbon_cost_addition = importer.get_carbon_cost_addition()
         df_cc = carbon_cost.df_carbon_cost
@@ -1636,16 +1626,13 @@ def _calculate_plant_numbers(
                 .reset_index(drop=False)
             )
 
-            df["plant_number"] = df[["product", "annual_production_volume"]].apply(
-                lambda x: int(
-                    x[1]
-                    / (
-                        ASSUMED_ANNUAL_PRODUCTION_CAPACITY_MT[x[0]]
-                        * CUF_UPPER_THRESHOLD
-                    )
-                ),
-                axis=1,
-            )
+            df["plant_number"] = (
+                df["annual_production_volume"]
+                / (
+                    df["product"].map(ASSUMED_ANNUAL_PRODUCTION_CAPACITY_MT)
+                    * CUF_UPPER_THRESHOLD
+                )
+            ).astype(int)
 
             # Sum over all products if requested
             if "product" not in agg_vars:
@@ -1,32 +1,29 @@
 """ Logic for technology transitions of type brownfield rebuild and brownfield renovation."""
-import random
 import sys
-from copy import deepcopy
 from operator import methodcaller
 
 import numpy as np
 import pandas as pd
 from ammonia.config_ammonia import (
     ANNUAL_RENOVATION_SHARE,
+    BROWNFIELD_RANDOM_SEED,
     BROWNFIELD_REBUILD_START_YEAR,
     BROWNFIELD_RENOVATION_START_YEAR,
     COST_METRIC_DECREASE_BROWNFIELD,
     LOG_LEVEL,
     RANKING_COST_METRIC,
-    REGIONAL_TECHNOLOGY_BAN,
     SWITCH_TYPES_UPDATE_YEAR_COMMISSIONED,
 )
-from mppshared.agent_logic.agent_logic_functions import (
-    apply_regional_technology_ban,
-    remove_all_transitions_with_destination_technology,
-    remove_transition,
-    select_best_transition,
-)
 from mppshared.agent_logic.brownfield import (
     apply_brownfield_filters_ammonia,
     apply_start_years_brownfield_transitions,
 )
-from mppshared.models.constraints import check_constraints
+from mppshared.models.asset import pack_assets
+from mppshared.models.constraints import (
+    check_constraints,
+    is_constraint_affected_by_technology,
+)
+from mppshared.models.ranking_table import RankingTable
 from mppshared.models.simulation_pathway import SimulationPathway
 from mppshared.utility.log_utility import get_logger
 from pandera import Bool
@@ -63,11 +60,6 @@ def brownfield(pathway: SimulationPathway, year: int) -> SimulationPathway:
         cost_metric_decrease_brownfield=COST_METRIC_DECREASE_BROWNFIELD,
     )
 
-    # Apply regional technology ban
-    df_rank = apply_regional_technology_ban(
-        df_rank, sector_bans=REGIONAL_TECHNOLOGY_BAN
-    )
-
     # Apply start years of brownfield transitions
     df_rank = apply_start_years_brownfield_transitions(
         df_rank=df_rank,
@@ -77,12 +69,36 @@ def brownfield(pathway: SimulationPathway, year: int) -> SimulationPathway:
         brownfield_rebuild_start_year=BROWNFIELD_REBUILD_START_YEAR,
     )
 
+    # Random number generator to choose between transitions and assets with the same rank, reproducible for each year
+    #   if a seed is set
+    rng = np.random.default_rng(
+        None if BROWNFIELD_RANDOM_SEED is None else [BROWNFIELD_RANDOM_SEED, year]
+    )
+
+    # Keep track of the remaining transitions in the ranking table
+    ranking = RankingTable(df_rank, rng=rng)
+
     # Get assets eligible for brownfield transitions
     candidates = new_stack.get_assets_eligible_for_brownfield(
         year=year,
         investment_cycle=pathway.investment_cycle,
     )
 
+    # Candidates packed into a structured array to filter them for each transition without a Python loop. Assets
+    #   eligible for both renovation and rebuild are listed twice, so slots are tracked by UUID
+    packed, codes = pack_assets(candidates)
+    cand_valid = np.ones(len(candidates), dtype=bool)
+
+    # Constraint checks of tentative transitions for the current stack, which changes with every enacted transition.
+    #   Transitions of assets with the same characteristics to the same technology lead to the same stack composition
+    constraints_cache = {}  # type: dict
+    stack_version = 0
+
+    # Constraints that a transition cannot change are fulfilled as for the current stack and checked once per product
+    #   and stack version
+    constraints_current_stack = {}  # type: dict
+    technology_affects_constraint = {}  # type: dict
+
     # Track number of assets that undergo transition to ensure that it stays below the revamp rate
     n_assets_transitioned = 0
     maximum_n_assets_transitioned = np.ceil(
@@ -94,63 +110,143 @@ def brownfield(pathway: SimulationPathway, year: int) -> SimulationPathway:
     )
 
     # Enact brownfield transitions while there are still candidates and the revamp rate is not exceeded
-    while (candidates != []) & (n_assets_transitioned <= maximum_n_assets_transitioned):
+    while cand_valid.any() and n_assets_transitioned <= maximum_n_assets_transitioned:
 
         # Find assets can undergo the best transition. If there are no assets for the best transition, continue searching with the next-best transition
-        best_candidates = []  # type: list
-        while not best_candidates:
+        best_idxs = np.array([], dtype=int)
+        while best_idxs.size == 0:
 
             # If no more transitions available, break and return pathway
-            if df_rank.empty:
+            if ranking.empty():
                 return pathway
 
             # Choose the best transition, i.e. highest decommission rank
-            best_transition = select_best_transition(df_rank)
+            best_index, best_transition = ranking.select_best_transition()
 
-            best_candidates = list(
-                filter(
-                    lambda asset: (
-                        asset.technology == best_transition["technology_origin"]
-                    )
-                    & (asset.region == best_transition["region"])
-                    & (asset.product == best_transition["product"]),
-                    candidates,
+            best_idxs = np.flatnonzero(
+                cand_valid
+                & (
+                    packed["technology"]
+                    == codes["technology"].get(best_transition["technology_origin"], -1)
+                )
+                & (
+                    packed["region"]
+                    == codes["region"].get(best_transition["region"], -1)
+                )
+                & (
+                    packed["product"]
+                    == codes["product"].get(best_transition["product"], -1)
                 )
             )
             new_technology = best_transition["technology_destination"]
             switch_type = best_transition["switch_type"]
 
             # Remove best transition from ranking table (other assets could undergo the same transition)
-            df_rank = remove_transition(df_rank, best_transition)
+            ranking.remove_transition(best_index)
 
         # If several candidates for best transition, choose asset for transition randomly
-        asset_to_update = random.choice(best_candidates)
+        best_idx = best_idxs[rng.integers(best_idxs.size)]
+        asset_to_update = candidates[best_idx]
 
-        # Update asset tentatively (needs deepcopy to provide changes to original stack)
-        tentative_stack = deepcopy(new_stack)
         origin_technology = asset_to_update.technology
-        tentative_stack.update_asset(
-            year=year,
-            asset_to_update=deepcopy(asset_to_update),
-            new_technology=new_technology,
-            new_classification=best_transition["technology_classification"],
-            asset_lifetime=best_transition["technology_lifetime"],
-            switch_type=switch_type,
-            origin_technology=origin_technology,
-            update_year_commission=False,
+        constraints_key = (
+            stack_version,
+            asset_to_update.product,
+            asset_to_update.region,
+            origin_technology,
+            asset_to_update.technology_classification,
+            asset_to_update.get_annual_production_capacity(),
+            asset_to_update.cuf,
+            new_technology,
+            best_transition["technology_classification"],
         )
+        if constraints_key not in constraints_cache:
 
-        # Check constraints with tentative new stack
-        dict_constraints = check_constraints(
-            pathway=pathway,
-            stack=tentative_stack,
-            year=year,
-            transition_type="brownfield",
-            product=best_transition["product"],
-        )
+            # Split constraints into those that the transition can change and those that it cannot
+            affected_constraints = []
+            for constraint in pathway.constraints_to_apply:
+                for technology in [origin_technology, new_technology]:
+                    if (constraint, technology) not in technology_affects_constraint:
+                        technology_affects_constraint[(constraint, technology)] = (
+                            is_constraint_affected_by_technology(
+                                pathway=pathway,
+                                constraint=constraint,
+                                technology=technology,
+                            )
+                        )
+                if (
+                    technology_affects_constraint[(constraint, origin_technology)]
+                    or technology_affects_constraint[(constraint, new_technology)]
+                ):
+                    affected_constraints.append(constraint)
+
+            unaffected_constraints = [
+                constraint
+                for constraint in pathway.constraints_to_apply
+                if constraint not in affected_constraints
+            ]
+            unchecked_constraints = [
+                constraint
+                for constraint in unaffected_constraints
+                if (stack_version, best_transition["product"], constraint)
+                not in constraints_current_stack
+            ]
+            if unchecked_constraints:
+                dict_current_stack = check_constraints(
+                    pathway=pathway,
+                    stack=new_stack,
+                    year=year,
+                    transition_type="brownfield",
+                    product=best_transition["product"],
+                    constraints_to_apply=unchecked_constraints,
+                )
+                for constraint in unchecked_constraints:
+                    constraints_current_stack[
+                        (stack_version, best_transition["product"], constraint)
+                    ] = dict_current_stack[constraint]
+
+            dict_constraints = {
+                constraint: constraints_current_stack[
+                    (stack_version, best_transition["product"], constraint)
+                ]
+                for constraint in unaffected_constraints
+            }
+
+            # Only update the asset and check the constraints with the tentative new stack if the transition can change
+            #   any of them
+            if affected_constraints:
+
+                # Update asset tentatively in place and revert the update after checking the constraints
+                undo = new_stack.update_asset(
+                    year=year,
+                    asset_to_update=asset_to_update,
+                    new_technology=new_technology,
+                    new_classification=best_transition["technology_classification"],
+                    asset_lifetime=best_transition["technology_lifetime"],
+                    switch_type=switch_type,
+                    origin_technology=origin_technology,
+                    update_year_commission=False,
+                )
+
+                # Check constraints with tentative new stack
+                dict_constraints.update(
+                    check_constraints(
+                        pathway=pathway,
+                        stack=new_stack,
+                        year=year,
+                        transition_type="brownfield",
+                        product=best_transition["product"],
+                        constraints_to_apply=affected_constraints,
+                    )
+                )
+                new_stack.revert_asset_update(undo)
+
+            constraints_cache[constraints_key] = dict_constraints
+
+        dict_constraints = constraints_cache[constraints_key]
 
         # If no constraint is hurt, execute the brownfield transition
-        if all(constraint == True for constraint in dict_constraints.values()):
+        if all(dict_constraints.values()):
             logger.debug(
                 f"Updating {asset_to_update.product} asset from technology {origin_technology} to technology {new_technology} in region {asset_to_update.region}, annual production {asset_to_update.get_annual_production_volume()} and UUID {asset_to_update.uuid}"
             )
@@ -174,9 +270,16 @@ def brownfield(pathway: SimulationPathway, year: int) -> SimulationPathway:
                 ),
             )
 
-            # Remove asset from candidates
-            candidates.remove(asset_to_update)
+            # Remove asset from candidates; a remaining slot of the same asset now has the new technology
+            slots = np.flatnonzero(
+                cand_valid & (packed["uuid"] == packed["uuid"][best_idx])
+            )
+            cand_valid[slots[0]] = False
+            packed["technology"][slots] = codes["technology"].setdefault(
+                new_technology, len(codes["technology"])
+            )
             n_assets_transitioned += 1
+            stack_version += 1
 
         # ELECTROLYSIS CAPACITY ADDITION
         elif (
@@ -187,8 +290,8 @@ def brownfield(pathway: SimulationPathway, year: int) -> SimulationPathway:
                 logger.debug(
                     f"Handle electrolysis capacity addition constraint: removing destination technology"
                 )
-                df_rank = remove_all_transitions_with_destination_technology(
-                    df_rank, best_transition["technology_destination"]
+                ranking.remove_all_transitions_with_destination_technology(
+                    best_transition["technology_destination"]
                 )
 
         # CO2 STORAGE
@@ -198,8 +301,8 @@ def brownfield(pathway: SimulationPathway, year: int) -> SimulationPathway:
                 logger.debug(
                     f"Handle CO2 storage constraint: removing destination technology"
                 )
-                df_rank = remove_all_transitions_with_destination_technology(
-                    df_rank, best_transition["technology_destination"]
+                ranking.remove_all_transitions_with_destination_technology(
+                    best_transition["technology_destination"]
                 )
 
         # GLOBAL DEMAND SHARE
@@ -209,8 +312,8 @@ def brownfield(pathway: SimulationPathway, year: int) -> SimulationPathway:
                 logger.debug(
                     f"Handle global demand share constraint: removing destination technology"
                 )
-                df_rank = remove_all_transitions_with_destination_technology(
-                    df_rank, best_transition["technology_destination"]
+                ranking.remove_all_transitions_with_destination_technology(
+                    best_transition["technology_destination"]
                 )
 
     logger.debug(f"{n_assets_transitioned} assets transitioned in year {year}.")
@@ -24,21 +24,25 @@ def decommission(pathway: SimulationPathway, year: int) -> SimulationPathway:
         Updated decarbonization pathway with the updated AssetStack in the subsequent year according to the decommission transitions enacted
     """
 
+    # Current stack is for calculating production, next year's stack is updated with each decommissioning
+    old_stack = pathway.get_stack(year=year)
+    new_stack = pathway.get_stack(year=year + 1)
+
+    # Get ranking table for decommissioning, split by product in a single pass
+    df_rank_all = pathway.get_ranking(year=year, rank_type="decommission")
+    df_rank_by_product = dict(
+        iter(df_rank_all.groupby("product", sort=False, observed=True))
+    )
+
     for product in PRODUCTS:
 
         logger.info(f"Running decommission logic for {product}")
 
-        # Current stack is for calculating production, next year's stack is updated with each decommissioning
-        old_stack = pathway.get_stack(year=year)
-        new_stack = pathway.get_stack(year=year + 1)
-
         # Get demand balance (demand - production)
         demand = pathway.get_demand(product, year, "Global")
         production = old_stack.get_annual_production_volume(product)
 
-        # Get ranking table for decommissioning
-        df_rank = pathway.get_ranking(year=year, rank_type="decommission")
-        df_rank = df_rank.loc[df_rank["product"] == product]
+        df_rank = df_rank_by_product.get(product, df_rank_all.iloc[0:0])
 
         # Decommission while production exceeds demand
         surplus = production - demand
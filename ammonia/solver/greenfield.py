@@ -10,7 +10,6 @@ from ammonia.config_ammonia import (
     REGIONAL_TECHNOLOGY_BAN,
     REGIONS,
 )
-from mppshared.agent_logic.agent_logic_functions import apply_regional_technology_ban
 from mppshared.agent_logic.greenfield import (
     create_dataframe_check_regional_share_global_demand,
     enact_greenfield_transition,
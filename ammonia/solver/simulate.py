@@ -1,8 +1,8 @@
 """Year-by-year optimisation logic of plant investment decisions to simulate a pathway for the ammonia supply
 technology mix."""
 
-from datetime import timedelta
-from timeit import default_timer as timer
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
 
 from ammonia.config_ammonia import (
     ANNUAL_RENOVATION_SHARE,
@@ -18,9 +18,12 @@ from ammonia.config_ammonia import (
     INVESTMENT_CYCLE,
     LOG_LEVEL,
     MAXIMUM_GLOBAL_DEMAND_SHARE,
+    PRODUCT_DTYPE,
     PRODUCTS,
     RANK_TYPES,
+    REGION_DTYPE,
     REGIONAL_PRODUCTION_SHARES,
+    REGIONAL_TECHNOLOGY_BAN,
     SET_CO2_STORAGE_CONSTRAINT,
     START_YEAR,
     TECHNOLOGIES_MAXIMUM_GLOBAL_DEMAND_SHARE,
@@ -28,8 +31,10 @@ from ammonia.config_ammonia import (
 from ammonia.solver.brownfield import brownfield
 from ammonia.solver.decommission import decommission
 from ammonia.solver.greenfield import greenfield
-from mppshared.agent_logic.agent_logic_functions import adjust_capacity_utilisation
-from mppshared.import_data.intermediate_data import IntermediateDataImporter
+from mppshared.agent_logic.agent_logic_functions import (
+    adjust_capacity_utilisation,
+    apply_regional_technology_ban,
+)
 from mppshared.models.carbon_cost_trajectory import CarbonCostTrajectory
 from mppshared.models.simulation_pathway import SimulationPathway
 from mppshared.utility.log_utility import get_logger
@@ -48,42 +53,64 @@ def simulate(pathway: SimulationPathway) -> SimulationPathway:
         The updated pathway with the asset stack in each year of the model horizon
     """
 
-    # Run pathway simulation in each year for all products simultaneously
-    for year in range(START_YEAR, END_YEAR + 1):
-        logger.info("Optimizing for %s", year)
-
-        # Adjust capacity utilisation of each asset
-        pathway = adjust_capacity_utilisation(pathway=pathway, year=year)
-
-        # Copy over last year's stack to this year
-        pathway = pathway.copy_stack(year=year)
-
-        # Write stack to csv
-        pathway.export_stack_to_csv(year)
-
-        # Decommission assets
-        start = timer()
-        pathway = decommission(pathway=pathway, year=year)
-        end = timer()
-        logger.debug(
-            f"Time elapsed for decommission in year {year}: {timedelta(seconds=end-start)} seconds"
-        )
-
-        # Renovate and rebuild assets (brownfield transition)
-        start = timer()
-        pathway = brownfield(pathway=pathway, year=year)
-        end = timer()
-        logger.debug(
-            f"Time elapsed for brownfield in year {year}: {timedelta(seconds=end-start)} seconds"
-        )
-
-        # Build new assets
-        start = timer()
-        pathway = greenfield(pathway=pathway, year=year)
-        end = timer()
-        logger.debug(
-            f"Time elapsed for greenfield in year {year}: {timedelta(seconds=end-start)} seconds"
-        )
+    # The regional technology ban is the same in every year, so it is applied to the brownfield rankings once
+    pathway.filter_rankings(
+        rank_type="brownfield",
+        filter_function=apply_regional_technology_ban,
+        sector_bans=REGIONAL_TECHNOLOGY_BAN,
+    )
+
+    # The decommission and brownfield rankings are filtered by product, region and technology many times per year
+    pathway.categorize_rankings(rank_types=["decommission", "brownfield"])
+
+    # Run pathway simulation in each year for all products simultaneously, writing the stacks to csv in a
+    #   background thread
+    with ThreadPoolExecutor(max_workers=1) as stack_writer:
+        stack_exports = []
+        for year in range(START_YEAR, END_YEAR + 1):
+            logger.info("Optimizing for %s", year)
+
+            # Adjust capacity utilisation of each asset
+            pathway = adjust_capacity_utilisation(pathway=pathway, year=year)
+
+            # Copy over last year's stack to this year
+            pathway = pathway.copy_stack(year=year)
+
+            # Write stack to csv in the background (the stack is exported to a DataFrame before it changes)
+            stack_exports.append(
+                pathway.export_stack_to_csv(year, executor=stack_writer)
+            )
+
+            # Decommission assets
+            start = perf_counter()
+            pathway = decommission(pathway=pathway, year=year)
+            logger.debug(
+                "Time elapsed for decommission in year %s: %.3f seconds",
+                year,
+                perf_counter() - start,
+            )
+
+            # Renovate and rebuild assets (brownfield transition)
+            start = perf_counter()
+            pathway = brownfield(pathway=pathway, year=year)
+            logger.debug(
+                "Time elapsed for brownfield in year %s: %.3f seconds",
+                year,
+                perf_counter() - start,
+            )
+
+            # Build new assets
+            start = perf_counter()
+            pathway = greenfield(pathway=pathway, year=year)
+            logger.debug(
+                "Time elapsed for greenfield in year %s: %.3f seconds",
+                year,
+                perf_counter() - start,
+            )
+
+        # Raise errors from writing the stacks
+        for stack_export in stack_exports:
+            stack_export.result()
 
     return pathway
 
@@ -121,6 +148,7 @@ def simulate_pathway(
         annual_renovation_share=ANNUAL_RENOVATION_SHARE,
         technologies_maximum_global_demand_share=TECHNOLOGIES_MAXIMUM_GLOBAL_DEMAND_SHARE,
         maximum_global_demand_share=MAXIMUM_GLOBAL_DEMAND_SHARE,
+        categorical_dtypes={"product": PRODUCT_DTYPE, "region": REGION_DTYPE},
         set_co2_storage_constraint=SET_CO2_STORAGE_CONSTRAINT,
         co2_storage_constraint_type=CO2_STORAGE_CONSTRAINT_TYPE,
     )
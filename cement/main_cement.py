@@ -1,10 +1,10 @@
 """Execute the MPP Cement model."""
 
+import importlib
 import multiprocessing as mp
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-from cement.archetype_explorer.ae_generate_output import ae_aggregate_outputs
-from cement.archetype_explorer.ae_implicit_forcing import ae_apply_implicit_forcing
-from cement.archetype_explorer.ae_ranking_inputs import ae_get_ranking_inputs
 from cement.config.config_cement import (
     PATHWAYS_SENSITIVITIES,
     PRODUCTS,
@@ -12,12 +12,6 @@ from cement.config.config_cement import (
     SECTOR,
     run_config,
 )
-from cement.solver.implicit_forcing import apply_implicit_forcing
-from cement.solver.output_processing import aggregate_outputs, calculate_outputs
-from cement.solver.preprocess import import_and_preprocess
-from cement.solver.ranking import make_rankings
-from cement.solver.ranking_inputs import get_ranking_inputs
-from cement.solver.simulate import simulate_pathway
 
 # Shared imports
 from mppshared.config import LOG_LEVEL
@@ -28,34 +22,56 @@ from mppshared.utility.utils import get_logger
 logger = get_logger(__name__)
 logger.setLevel(LOG_LEVEL)
 
+# Module and name of the function of each section, imported only when the section is run
 funcs = {
     # MAIN MODEL #
-    "IMPORT_DATA": import_and_preprocess,
-    "CALCULATE_VARIABLES": get_ranking_inputs,
-    "APPLY_IMPLICIT_FORCING": apply_implicit_forcing,
-    "MAKE_RANKINGS": make_rankings,
-    "SIMULATE_PATHWAY": simulate_pathway,
-    "CALCULATE_OUTPUTS": calculate_outputs,
+    "IMPORT_DATA": ("cement.solver.preprocess", "import_and_preprocess"),
+    "CALCULATE_VARIABLES": ("cement.solver.ranking_inputs", "get_ranking_inputs"),
+    "APPLY_IMPLICIT_FORCING": (
+        "cement.solver.implicit_forcing",
+        "apply_implicit_forcing",
+    ),
+    "MAKE_RANKINGS": ("cement.solver.ranking", "make_rankings"),
+    "SIMULATE_PATHWAY": ("cement.solver.simulate", "simulate_pathway"),
+    "CALCULATE_OUTPUTS": ("cement.solver.output_processing", "calculate_outputs"),
     # ARCHETYPE EXPLORER #
-    "AE_IMPORT_DATA": import_and_preprocess,
-    "AE_CALCULATE_VARIABLES": ae_get_ranking_inputs,
-    "AE_APPLY_IMPLICIT_FORCING": ae_apply_implicit_forcing,
+    "AE_IMPORT_DATA": ("cement.solver.preprocess", "import_and_preprocess"),
+    "AE_CALCULATE_VARIABLES": (
+        "cement.archetype_explorer.ae_ranking_inputs",
+        "ae_get_ranking_inputs",
+    ),
+    "AE_APPLY_IMPLICIT_FORCING": (
+        "cement.archetype_explorer.ae_implicit_forcing",
+        "ae_apply_implicit_forcing",
+    ),
 }
+_loaded_funcs = {}
+
+
+def _get_func(name: str):
+    """Import the function of a section on first use"""
+    if name not in _loaded_funcs:
+        module, func_name = funcs[name]
+        _loaded_funcs[name] = getattr(importlib.import_module(module), func_name)
+    return _loaded_funcs[name]
+
+
+# Sections in run_config in the order in which they are run (run_config does not change during the model run)
+_ACTIVE_STAGES = tuple(name for name in funcs if name in run_config)
 
 
 def _run_model(pathway_name: str, sensitivity: str):
-    for name, func in funcs.items():
-        if name in run_config:
-            assert not ("AE_" in name and pathway_name != "archetype")
-            logger.info(
-                f"Running pathway {pathway_name} sensitivity {sensitivity} section {name}"
-            )
-            func(
-                pathway_name=pathway_name,
-                sensitivity=sensitivity,
-                sector=SECTOR,
-                products=PRODUCTS,
-            )
+    for name in _ACTIVE_STAGES:
+        assert not ("AE_" in name and pathway_name != "archetype")
+        logger.info(
+            f"Running pathway {pathway_name} sensitivity {sensitivity} section {name}"
+        )
+        _get_func(name)(
+            pathway_name=pathway_name,
+            sensitivity=sensitivity,
+            sector=SECTOR,
+            products=PRODUCTS,
+        )
 
 
 def run_model_sequential(runs: list):
@@ -68,12 +84,31 @@ def run_model_parallel(runs: list):
     """Run model in parallel, faster but harder to debug"""
     n_cores = mp.cpu_count()
     logger.info(f"{n_cores} cores detected")
-    pool = mp.Pool(processes=n_cores - 1)
     logger.info(f"Running model for scenario/sensitivity {runs}")
-    for pathway, sensitivity in runs:
-        pool.apply_async(_run_model, args=(pathway, sensitivity))
-    pool.close()
-    pool.join()
+    # One core is left for the main process, but there are no more worker processes than runs
+    n_workers = max(min(len(runs), n_cores - 1), 1)
+    # Fork worker processes on Linux, so that they inherit the imported modules and the parsed business cases of the
+    #   main process instead of loading them again. Elsewhere, forking is unsafe (macOS) or unavailable (Windows): the
+    #   workers use the default start method, only import the modules of the sections they run and read the parsed
+    #   business cases from the on-disk cache
+    if sys.platform == "linux":
+        mp_context = mp.get_context("fork")
+        for name in _ACTIVE_STAGES:
+            _get_func(name)
+    else:
+        mp_context = None
+    # The workers must not share the file handles of the workbooks opened by the main process
+    from mppshared.import_data.intermediate_data import close_business_case_workbooks
+
+    close_business_case_workbooks()
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp_context) as executor:
+        futures = [
+            executor.submit(_run_model, pathway, sensitivity)
+            for pathway, sensitivity in runs
+        ]
+        # Raise exceptions of failed runs as soon as they occur
+        for future in as_completed(futures):
+            future.result()
 
 
 def main():
@@ -85,6 +120,12 @@ def main():
         for sensitivity in sensitivities:
             runs.append((pathway_name, sensitivity))
 
+    # parse the business cases once for all runs (the imported data itself depends on pathway and sensitivity)
+    if {"IMPORT_DATA", "AE_IMPORT_DATA"} & run_config:
+        from cement.solver.preprocess import preload_business_cases
+
+        preload_business_cases(sector=SECTOR, products=PRODUCTS)
+
     # run
     if RUN_PARALLEL:
         run_model_parallel(runs)
@@ -94,8 +135,14 @@ def main():
     # aggregate outputs of all runs if more than one pathway is modelled
     if len(runs) > 1:
         if pathway_name != "archetype":
+            from cement.solver.output_processing import aggregate_outputs
+
             aggregate_outputs(runs=runs, sector=SECTOR)
         else:
+            from cement.archetype_explorer.ae_generate_output import (
+                ae_aggregate_outputs,
+            )
+
             ae_aggregate_outputs(runs=runs, sector=SECTOR)
 
 
@@ -15,6 +15,9 @@ from mppshared.utility.utils import get_logger
 logger = get_logger(__name__)
 logger.setLevel(LOG_LEVEL)
 
+# Metrics extracted from the business cases, shared by all pathways and sensitivities that are run in the process
+_business_case_metrics: dict = {}
+
 
 def import_all(
     importer: IntermediateDataImporter,
@@ -49,6 +52,76 @@ def import_all(
 
     """
 
+    dict_metrics = load_business_case_metrics(
+        importer=importer,
+        model_years=model_years,
+        model_regions=model_regions,
+        input_sheets=input_sheets,
+        input_metrics=input_metrics,
+        map_excel_names=map_excel_names,
+        idx_per_input_metric=idx_per_input_metric,
+        datatypes_per_column=datatypes_per_column,
+        column_single_input=column_single_input,
+        header_business_case_excel=header_business_case_excel,
+        excel_column_ranges=excel_column_ranges,
+    )
+
+    # export
+    for metric, df in dict_metrics.items():
+        importer.export_data(
+            df=df,
+            filename=f"{metric}.csv",
+            export_dir="import",
+        )
+
+
+def load_business_case_metrics(
+    importer: IntermediateDataImporter,
+    model_years: np.ndarray,
+    model_regions: list,
+    input_sheets: list,
+    input_metrics: dict,
+    map_excel_names: dict,
+    idx_per_input_metric: dict,
+    datatypes_per_column: dict,
+    column_single_input: str,
+    header_business_case_excel: int,
+    excel_column_ranges: dict,
+) -> dict:
+    """
+    Load all input data from the business cases and reformat to long format. The business cases are the same for all
+        pathways and sensitivities, so the metrics are only extracted once per process and workbook.
+
+    Args:
+        importer ():
+        model_years ():
+        model_regions ():
+        input_sheets ():
+        input_metrics ():
+        map_excel_names ():
+        idx_per_input_metric ():
+        datatypes_per_column ():
+        column_single_input ():
+        header_business_case_excel ():
+        excel_column_ranges ():
+
+    Returns:
+        dict: DataFrames indexed by idx_per_input_metric with metrics as keys (shared, must not be modified)
+    """
+
+    # Extract the metrics only once as long as the workbook does not change
+    metrics_key = (
+        importer.get_business_case_workbook_key(),
+        tuple(
+            (sheet_name, tuple(metric_list))
+            for sheet_name, metric_list in input_metrics.items()
+        ),
+        tuple(model_years),
+        tuple(model_regions),
+    )
+    if metrics_key in _business_case_metrics:
+        return _business_case_metrics[metrics_key]
+
     # Mapping of regions to cost classification
     region_to_cost = get_region_to_capex_mapping(
         importer=importer,
@@ -59,23 +132,33 @@ def import_all(
     )
 
     # Load input data from business cases, prices and emissions
+    dict_metrics = {}
     for sheet_name, metric_list in input_metrics.items():
 
+        # Import and clean corresponding sheet once for all of its metrics
+        df_sheet = importer.get_raw_input_data(
+            sheet_name=sheet_name,
+            header_business_case_excel=header_business_case_excel,
+            excel_column_ranges=excel_column_ranges,
+        )
+        df_sheet = clean_business_case_data(
+            df=df_sheet,
+            model_years=model_years,
+            column_single_input=column_single_input,
+        )
+
+        # Split sheet by metric type once instead of filtering the entire sheet for every metric
+        dfs_metric_type = dict(iter(df_sheet.groupby("Metric type", sort=False)))
+
         for metric in metric_list:
 
             logger.info(f"Importing metric {metric} from sheet {sheet_name}.")
 
-            # Import and extract corresponding sheet
-            df = importer.get_raw_input_data(
-                sheet_name=sheet_name,
-                header_business_case_excel=header_business_case_excel,
-                excel_column_ranges=excel_column_ranges,
-            )
+            # Extract metric from the rows of its metric type
             df = extract_business_case_data(
-                df=df,
+                df=dfs_metric_type.get(map_excel_names[metric][0], df_sheet.iloc[0:0]),
                 metric=metric,
                 model_years=model_years,
-                column_single_input=column_single_input,
                 idx_per_input_metric=idx_per_input_metric,
                 map_excel_names=map_excel_names,
             )
@@ -101,36 +184,30 @@ def import_all(
             df = set_datatypes(df=df, datatypes_per_column=datatypes_per_column)
 
             # set and sort index
-            df = df.set_index(keys=idx_per_input_metric[metric]).sort_index()
+            dict_metrics[metric] = df.set_index(
+                keys=idx_per_input_metric[metric]
+            ).sort_index()
 
-            # export
-            importer.export_data(
-                df=df,
-                filename=f"{metric}.csv",
-                export_dir="import",
-            )
+    _business_case_metrics[metrics_key] = dict_metrics
 
+    return dict_metrics
 
-def extract_business_case_data(
+
+def clean_business_case_data(
     df: pd.DataFrame,
-    metric: str,
     model_years: np.ndarray,
     column_single_input: str,
-    map_excel_names: dict,
-    idx_per_input_metric: dict,
 ) -> pd.DataFrame:
-    """Extract data for the specified metric from the DataFrame passed and rename columns to standard column names.
+    """Copy single inputs to every year, remove special space characters and drop empty rows of a sheet of the
+    business cases.
 
     Args:
-        df: DataFrame containing the business cases data
-        metric (str): Name of the dataseries to be loaded.
+        df: DataFrame containing the business cases data (modified in place where single inputs are copied)
         model_years ():
         column_single_input ():
-        map_excel_names ():
-        idx_per_input_metric ():
 
     Returns:
-        pd.DataFrame: Loaded data
+        pd.DataFrame: Cleaned data
     """
 
     # If single input, copy single value to every year to make subsequent calculations easy
@@ -146,6 +223,30 @@ def extract_business_case_data(
     # Drop rows with only NaN
     df = df.dropna(how="all", axis=0)
 
+    return df
+
+
+def extract_business_case_data(
+    df: pd.DataFrame,
+    metric: str,
+    model_years: np.ndarray,
+    map_excel_names: dict,
+    idx_per_input_metric: dict,
+) -> pd.DataFrame:
+    """Extract data for the specified metric from the DataFrame passed and rename columns to standard column names.
+
+    Args:
+        df: DataFrame containing the cleaned business cases data (see clean_business_case_data), e.g. only the rows
+            with the metric type of the metric
+        metric (str): Name of the dataseries to be loaded.
+        model_years ():
+        map_excel_names ():
+        idx_per_input_metric ():
+
+    Returns:
+        pd.DataFrame: Loaded data
+    """
+
     # extract metric
     metric_filter = map_excel_names[metric]
 
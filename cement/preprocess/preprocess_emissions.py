@@ -7,7 +7,7 @@ from mppshared.config import GHG_CONVERSION, IDX_EMISSIVITY, LOG_LEVEL
 from mppshared.utility.log_utility import get_logger
 from mppshared.utility.utils import (
     extend_to_all_technologies,
-    filter_input_metrics,
+    filter_component_metrics,
     get_unique_list_values,
 )
 
@@ -349,39 +349,33 @@ def _get_ccus_process_emissivity(
         df_cc_emissivity (): Unit: [t CO2 / t production_output]
     """
 
-    df_list = []
-    for ccus_process_cost_component in emissivity_ccus_process_metrics:
-
-        df_subcomponent_list = []
-        for subcomponent in ccus_process_cost_component.keys():
-            # filter all relevant energy inputs
-            idx_subcomponent = [
-                x
-                for x in input_data[subcomponent].index.names
-                if x not in ["metric", "unit"]
-            ]
-            df_subcomponent = filter_input_metrics(
-                df=input_data[subcomponent].copy().reset_index(),
-                list_metrics=ccus_process_cost_component[subcomponent],
-            )
-            df_subcomponent = (
-                df_subcomponent[idx_subcomponent + ["value"]]
-                .set_index(idx_subcomponent)
-                .sort_index()
-            )
-            # append to df_subcomponent_list
-            df_subcomponent_list.append(df_subcomponent)
-        # multiply
-        df_cc_emissivity_component = df_subcomponent_list[0].mul(
-            df_subcomponent_list[1]
+    # filter both subcomponents for the metrics of all emissivity components at once and keep the position of the
+    #   emissivity component as an additional index level, such that all emissivity components are multiplied in one go
+    df_subcomponent_list = []
+    for subcomponent in emissivity_ccus_process_metrics[0].keys():
+        idx_subcomponent = ["component"] + [
+            x
+            for x in input_data[subcomponent].index.names
+            if x not in ["metric", "unit"]
+        ]
+        df_subcomponent = filter_component_metrics(
+            df=input_data[subcomponent].reset_index(),
+            components=emissivity_ccus_process_metrics,
+            subcomponent=subcomponent,
+        )
+        df_subcomponent = (
+            df_subcomponent[idx_subcomponent + ["value"]]
+            .set_index(idx_subcomponent)
+            .sort_index()
         )
-        # append to df_list
-        df_list.append(df_cc_emissivity_component)
+        # append to df_subcomponent_list
+        df_subcomponent_list.append(df_subcomponent)
+    # multiply
+    df_cc_emissivity = df_subcomponent_list[0].mul(df_subcomponent_list[1])
 
-    # concat and groupby
-    df_cc_emissivity = pd.concat(df_list)
+    # sum over all emissivity components
     df_cc_emissivity = df_cc_emissivity.groupby(
-        list(df_cc_emissivity.index.names)
+        [x for x in df_cc_emissivity.index.names if x != "component"]
     ).sum()
     df_cc_emissivity["metric"] = "CC capture process emissions"
     df_cc_emissivity = (
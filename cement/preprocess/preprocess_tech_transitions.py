@@ -11,7 +11,11 @@ from mppshared.import_data.intermediate_data import IntermediateDataImporter
 from mppshared.models.carbon_cost_trajectory import CarbonCostTrajectory
 from mppshared.utility.dataframe_utility import df_dict_to_df
 from mppshared.utility.log_utility import get_logger
-from mppshared.utility.utils import filter_input_metrics, get_unique_list_values
+from mppshared.utility.utils import (
+    filter_component_metrics,
+    filter_input_metrics,
+    get_unique_list_values,
+)
 
 # Create logger
 logger = get_logger(__name__)
@@ -1040,38 +1044,32 @@ def _opex_get_ccus_process_cost(
         df_ov_ccus_process (): Unit: [USD / t production_output] or [USD / t CO2]
     """
 
-    df_list = []
-    for ccus_process_cost_component in opex_ccus_process_metrics:
-
-        df_subcomponent_list = []
-        for subcomponent in ccus_process_cost_component.keys():
-            # filter all relevant energy inputs
-            idx_subcomponent = [
-                x
-                for x in idx_per_input_metric[subcomponent]
-                if x not in ["cost_classification", "metric", "unit"]
-            ]
-            df_subcomponent = filter_input_metrics(
-                df=input_data[subcomponent].reset_index(),
-                list_metrics=ccus_process_cost_component[subcomponent],
-            )
-            df_subcomponent = (
-                df_subcomponent[idx_subcomponent + ["value"]]
-                .set_index(idx_subcomponent)
-                .sort_index()
-            )
-            # append to df_subcomponent_list
-            df_subcomponent_list.append(df_subcomponent)
-        # multiply
-        df_capture_cost_component = df_subcomponent_list[0].mul(df_subcomponent_list[1])
-        # append to df_list
-        df_list.append(df_capture_cost_component)
-
-    # concat and groupby
-    df_ov_ccus_process = pd.concat(df_list).reorder_levels(idx_opex)
-    df_ov_ccus_process = df_ov_ccus_process.groupby(
-        list(df_ov_ccus_process.index.names)
-    ).sum()
+    # filter both subcomponents for the metrics of all cost components at once and keep the position of the cost
+    #   component as an additional index level, such that all cost components are multiplied in one go
+    df_subcomponent_list = []
+    for subcomponent in opex_ccus_process_metrics[0].keys():
+        idx_subcomponent = ["component"] + [
+            x
+            for x in idx_per_input_metric[subcomponent]
+            if x not in ["cost_classification", "metric", "unit"]
+        ]
+        df_subcomponent = filter_component_metrics(
+            df=input_data[subcomponent].reset_index(),
+            components=opex_ccus_process_metrics,
+            subcomponent=subcomponent,
+        )
+        df_subcomponent = (
+            df_subcomponent[idx_subcomponent + ["value"]]
+            .set_index(idx_subcomponent)
+            .sort_index()
+        )
+        # append to df_subcomponent_list
+        df_subcomponent_list.append(df_subcomponent)
+    # multiply
+    df_ov_ccus_process = df_subcomponent_list[0].mul(df_subcomponent_list[1])
+
+    # sum over all cost components
+    df_ov_ccus_process = df_ov_ccus_process.groupby(idx_opex).sum()
     df_ov_ccus_process = df_ov_ccus_process.sort_index()
 
     return df_ov_ccus_process
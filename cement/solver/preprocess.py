@@ -1,5 +1,7 @@
 """import and pre-process all input files"""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 from cement.config.config_cement import (
@@ -23,7 +25,7 @@ from cement.config.import_config_cement import (
     INPUT_SHEETS,
     MAP_EXCEL_NAMES,
 )
-from cement.preprocess.import_data import import_all
+from cement.preprocess.import_data import import_all, load_business_case_metrics
 from mppshared.config import LOG_LEVEL
 from mppshared.import_data.intermediate_data import IntermediateDataImporter
 from mppshared.utility.dataframe_utility import set_datatypes
@@ -33,6 +35,53 @@ logger = get_logger(__name__)
 logger.setLevel(LOG_LEVEL)
 
 
+def preload_business_cases(sector: str, products: list):
+    """Parse all sheets of the business cases workbook that import_and_preprocess reads and extract the business case
+    metrics once before the runs of all pathways and sensitivities. Both are cached in the process (and inherited by
+    forked worker processes), so that every run reuses them instead of parsing the workbook and extracting the metrics
+    again.
+
+    Args:
+        sector: sector of the model
+        products: products of the sector
+    """
+    importer = IntermediateDataImporter(
+        pathway_name="",
+        sensitivity="",
+        sector=sector,
+        products=products,
+        carbon_cost_trajectory=None,
+        business_case_excel_filename="business_cases.xlsx",
+    )
+    # Every sheet that is read has a column range. The sheets are independent of each other and parsed in parallel
+    #   threads, which overlaps reading the workbook and (with the calamine engine) parsing outside of the GIL
+    with ThreadPoolExecutor(max_workers=len(EXCEL_COLUMN_RANGES)) as executor:
+        futures = [
+            executor.submit(
+                importer.get_raw_input_data,
+                sheet_name=sheet_name,
+                header_business_case_excel=HEADER_BUSINESS_CASE_EXCEL,
+                excel_column_ranges=EXCEL_COLUMN_RANGES,
+            )
+            for sheet_name in EXCEL_COLUMN_RANGES
+        ]
+        for future in futures:
+            future.result()
+    load_business_case_metrics(
+        importer=importer,
+        model_years=MODEL_YEARS,
+        model_regions=REGIONS,
+        input_sheets=INPUT_SHEETS,
+        input_metrics=INPUT_METRICS,
+        map_excel_names=MAP_EXCEL_NAMES,
+        idx_per_input_metric=IDX_PER_INPUT_METRIC,
+        column_single_input=COLUMN_SINGLE_INPUT,
+        datatypes_per_column=DF_DATATYPES_PER_COLUMN,
+        header_business_case_excel=HEADER_BUSINESS_CASE_EXCEL,
+        excel_column_ranges=EXCEL_COLUMN_RANGES,
+    )
+
+
 def import_and_preprocess(
     sector: str, products: list, pathway_name: str, sensitivity: str
 ):
@@ -1,4 +1,6 @@
 """Create inputs for ranking of technology switches (cost metrics, emissions, and technology characteristics)."""
+import hashlib
+
 import pandas as pd
 from cement.config.config_cement import (
     ALL_TECHNOLOGIES,
@@ -43,6 +45,10 @@ from mppshared.utility.log_utility import get_logger
 logger = get_logger(__name__)
 logger.setLevel(LOG_LEVEL)
 
+# Emissions calculated in the process, keyed by their input data. The sensitivities only adjust prices, carbon cost and
+#   technologies, so that the runs of all sensitivities (and pathways) with the same business cases share the emissions
+_emissions: dict = {}
+
 
 def get_ranking_inputs(
     sector: str, products: list, pathway_name: str, sensitivity: str
@@ -74,17 +80,7 @@ def get_ranking_inputs(
         )
 
     # get emissions
-    df_emissions = calculate_emissions(
-        dict_emissivity={
-            x: imported_input_data[x]
-            for x in INPUT_METRICS["Shared inputs - Emissivity"]
-        },
-        df_inputs_energy=imported_input_data["inputs_energy"],
-        df_capture_rate=imported_input_data["capture_rate"],
-        list_technologies=ALL_TECHNOLOGIES,
-        emissivity_ccus_process_metrics_energy=EMISSIVITY_CCUS_PROCESS_METRICS_ENERGY,
-        idx_per_input_metric=IDX_PER_INPUT_METRIC,
-    )
+    df_emissions = _get_emissions(imported_input_data=imported_input_data)
     # export
     importer.export_data(
         df=df_emissions,
@@ -177,6 +173,50 @@ def get_ranking_inputs(
     )
 
 
+def _get_emissions(imported_input_data: dict) -> pd.DataFrame:
+    """Calculate the emissions from the imported input data, unless they have already been calculated from identical
+    data in an earlier run of the process.
+
+    Args:
+        imported_input_data (): imported input data of the run with metrics as keys
+
+    Returns:
+        pd.DataFrame: emissions per technology for all scopes
+    """
+    metrics = list(INPUT_METRICS["Shared inputs - Emissivity"]) + [
+        "inputs_energy",
+        "capture_rate",
+    ]
+    # identify the input data by its content, since every run imports it from its own directory
+    emissions_key = tuple(
+        (
+            metric,
+            tuple(imported_input_data[metric].index.names),
+            tuple(imported_input_data[metric].columns),
+            hashlib.sha1(
+                pd.util.hash_pandas_object(imported_input_data[metric]).to_numpy()
+            ).hexdigest(),
+        )
+        for metric in metrics
+    )
+    if emissions_key not in _emissions:
+        _emissions[emissions_key] = calculate_emissions(
+            dict_emissivity={
+                x: imported_input_data[x]
+                for x in INPUT_METRICS["Shared inputs - Emissivity"]
+            },
+            df_inputs_energy=imported_input_data["inputs_energy"],
+            df_capture_rate=imported_input_data["capture_rate"],
+            list_technologies=ALL_TECHNOLOGIES,
+            emissivity_ccus_process_metrics_energy=EMISSIVITY_CCUS_PROCESS_METRICS_ENERGY,
+            idx_per_input_metric=IDX_PER_INPUT_METRIC,
+        )
+    else:
+        logger.info("Reusing emissions calculated from identical input data")
+
+    return _emissions[emissions_key].copy()
+
+
 def _apply_power_price_adjustments(
     sensitivity_metrics: str,
     sensitivity_percentage_change: float,
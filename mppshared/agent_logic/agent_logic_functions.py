@@ -1,6 +1,6 @@
 """ Additional functions required for the agent logic, e.g. demand balances. """
 
-from operator import methodcaller
+from collections import defaultdict
 
 import pandas as pd
 from mppshared.config import (
@@ -13,6 +13,7 @@ from mppshared.config import (
 from mppshared.import_data.intermediate_data import IntermediateDataImporter
 from mppshared.models.simulation_pathway import SimulationPathway
 from mppshared.models.technology_rampup import TechnologyRampup
+from mppshared.solver.implicit_forcing import apply_regional_technology_ban  # noqa: F401
 from mppshared.utility.utils import get_logger
 
 logger = get_logger(__name__)
@@ -38,6 +39,22 @@ def select_best_transition(df_rank: pd.DataFrame) -> dict:
     )[0]
 
 
+def group_assets_by_transition_origin(assets: list) -> dict:
+    """Group assets by technology, region and product, i.e. the columns "technology_origin", "region" and "product"
+    that select the assets for a transition from the ranking table. The order of the assets is kept within each group.
+
+    Args:
+        assets: list of Assets
+
+    Returns:
+        dict with (technology, region, product) as keys and lists of Assets as values
+    """
+    groups = defaultdict(list)
+    for asset in assets:
+        groups[(asset.technology, asset.region, asset.product)].append(asset)
+    return groups
+
+
 def remove_transition(df_rank: pd.DataFrame, transition: dict) -> pd.DataFrame:
     """Remove specific transition from ranking table.
 
@@ -267,17 +284,22 @@ def increase_cuf_of_assets(
     )
 
     # Increase CUF of assets to upper threshold in order of ascending LCOX until production meets
-    # demand or no assets left for CUF increase
-    while demand > stack.get_annual_production_volume(product):
+    # demand or no assets left for CUF increase (production is updated by the change of each asset instead of
+    # summing over the entire stack again)
+    production = stack.get_annual_production_volume(product)
+    for asset in assets_below_cuf_threshold:
 
-        if not assets_below_cuf_threshold:
+        if demand <= production:
             break
 
-        # Increase CUF of asset with lowest LCOX to upper threshold and remove from list
-        asset = assets_below_cuf_threshold[0]
+        # Increase CUF of asset with lowest LCOX to upper threshold
         # logger.debug(f"Increase CUF of {str(asset)}")
+        production += asset.get_annual_production_capacity() * (
+            cuf_upper_threshold - asset.cuf
+        )
         asset.cuf = cuf_upper_threshold
-        assets_below_cuf_threshold.pop(0)
+
+    stack.reset_production_totals()
 
     return pathway
 
@@ -306,16 +328,20 @@ def decrease_cuf_of_assets(
 
     # Decrease CUF of assets to lower threshold in order of descending LCOX until production meets
     # demand or no assets left for CUF decrease
-    while stack.get_annual_production_volume(product) > demand:
+    production = stack.get_annual_production_volume(product)
+    for _asset in assets_above_cuf_threshold:
 
-        if not assets_above_cuf_threshold:
+        if production <= demand:
             break
 
-        # Increase CUF of asset with lowest LCOX to upper threshold and remove from list
-        _asset = assets_above_cuf_threshold[0]
+        # Decrease CUF of asset with highest LCOX to lower threshold
         # logger.debug(f"Decrease CUF of {str(asset)}")
+        production -= _asset.get_annual_production_capacity() * (
+            _asset.cuf - cuf_lower_threshold
+        )
         _asset.cuf = cuf_lower_threshold
-        assets_above_cuf_threshold.pop(0)
+
+    stack.reset_production_totals()
 
     return pathway
 
@@ -328,11 +354,21 @@ def sort_assets_cost_metric(
     descending=False,
 ):
     """Sort list of assets according to a cost metric (LCOX or MC) in the specified year in ascending order"""
-    return sorted(
-        assets,
-        key=methodcaller(f"get_{cost_metric}", df_cost=pathway.df_cost, year=year),
-        reverse=descending,
-    )
+    if not assets:
+        return []
+
+    # Look up the cost metric of all assets at once instead of querying the cost DataFrame for every asset (the first
+    #   matching row counts, as in Asset.get_lcox and Asset.get_mc)
+    cost_column = {"lcox": "lcox", "mc": "marginal_cost"}[cost_metric]
+    keys = ["product", "region", "technology_destination"]
+    df_cost = pathway.df_cost.query(f"technology_origin=='New-build' & year=={year}")
+    cost = df_cost.drop_duplicates(subset=keys).set_index(keys)[cost_column]
+    asset_cost = cost.loc[
+        [(asset.product, asset.region, asset.technology) for asset in assets]
+    ].to_numpy()
+
+    order = sorted(range(len(assets)), key=asset_cost.__getitem__, reverse=descending)
+    return [assets[i] for i in order]
 
 
 def create_dict_technology_rampup(
@@ -403,21 +439,6 @@ def create_dict_technology_rampup(
     return dict_technology_rampup
 
 
-def apply_regional_technology_ban(
-    df_technology_switches: pd.DataFrame, sector_bans: dict
-) -> pd.DataFrame:
-    """Remove certain technologies from the technology switching table that are banned in certain regions (defined in
-    config.py)"""
-    if not sector_bans:
-        return df_technology_switches
-    for region in sector_bans.keys():
-        banned_transitions = (df_technology_switches["region"] == region) & (
-            df_technology_switches["technology_destination"].isin(sector_bans[region])
-        )
-        df_technology_switches = df_technology_switches.loc[~banned_transitions]
-    return df_technology_switches
-
-
 def get_constraints_to_apply(
     pathway_constraints_to_apply: list,
     origin_technology: str,
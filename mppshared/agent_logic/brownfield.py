@@ -42,47 +42,46 @@ def apply_brownfield_filters_ammonia(
 
     cost_metric = ranking_cost_metric
 
-    # Get LCOX of origin technologies for retrofit
+    # Get LCOX of origin and destination technologies for retrofit
     df_greenfield = pathway.get_ranking(year=year, rank_type="greenfield")
     df_lcox = df_greenfield.loc[df_greenfield["technology_origin"] == "New-build"]
-    df_lcox = df_lcox[
-        [
-            "product",
-            "region",
-            "technology_destination",
-            "year",
-            cost_metric,
-        ]
+    lcox = df_lcox.set_index(["product", "region", "technology_destination", "year"])[
+        cost_metric
     ]
-
-    df_destination_techs = df_lcox.rename(
-        {cost_metric: f"{cost_metric}_destination"}, axis=1
+    lcox = lcox.loc[~lcox.index.duplicated()]
+
+    # Look up the LCOX of all transitions at once (0 if not available) and filter out brownfield transitions which
+    #   would not decrease LCOX "substantially"
+    lcox_origin = (
+        lcox.reindex(
+            pd.MultiIndex.from_frame(
+                df_rank[["product", "region", "technology_origin", "year"]]
+            )
+        )
+        .fillna(0)
+        .to_numpy()
+    )
+    lcox_destination = (
+        lcox.reindex(
+            pd.MultiIndex.from_frame(
+                df_rank[["product", "region", "technology_destination", "year"]]
+            )
+        )
+        .fillna(0)
+        .to_numpy()
     )
+    df_rank = df_rank.loc[
+        lcox_destination < lcox_origin * (1 - cost_metric_decrease_brownfield)
+    ]
 
-    df_origin_techs = df_lcox.rename(
+    # Set all other missing values (e.g., technology lifetimes) to 0 as well, so that they never reach the asset stack.
+    #   Categorical columns are keys of the ranking and cannot hold 0
+    df_rank = df_rank.fillna(
         {
-            "technology_destination": "technology_origin",
-            cost_metric: f"{cost_metric}_origin",
-        },
-        axis=1,
+            col: 0
+            for col in df_rank.columns
+            if not isinstance(df_rank[col].dtype, pd.CategoricalDtype)
+        }
     )
 
-    # Add to ranking table and filter out brownfield transitions which would not decrease LCOX "substantially"
-    df_rank = df_rank.merge(
-        df_origin_techs,
-        on=["product", "region", "technology_origin", "year"],
-        how="left",
-    ).fillna(0)
-
-    df_rank = df_rank.merge(
-        df_destination_techs,
-        on=["product", "region", "technology_destination", "year"],
-        how="left",
-    ).fillna(0)
-
-    _filter = df_rank[f"{cost_metric}_destination"] < df_rank[
-        f"{cost_metric}_origin"
-    ].apply(lambda x: x * (1 - cost_metric_decrease_brownfield))
-    df_rank = df_rank.loc[_filter]
-
     return df_rank
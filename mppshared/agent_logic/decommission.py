@@ -4,6 +4,7 @@ import random
 
 import pandas as pd
 from mppshared.agent_logic.agent_logic_functions import (
+    group_assets_by_transition_origin,
     remove_transition,
     select_best_transition,
 )
@@ -51,19 +52,20 @@ def get_best_asset_to_decommission(
 
     # Select best asset to decommission from the list of candidates
     logger.debug(f"Candidates for decommissioning: {len(candidates)}")
+    candidates_by_origin = group_assets_by_transition_origin(candidates)
 
     best_candidates: list[Asset] = []
     while not best_candidates:
 
         best_transition = select_best_transition(df_rank)
 
-        best_candidates = list(
-            filter(
-                lambda asset: (asset.technology == best_transition["technology_origin"])
-                & (asset.region == best_transition["region"])
-                & (asset.product == best_transition["product"]),
-                candidates,
-            )
+        best_candidates = candidates_by_origin.get(
+            (
+                best_transition["technology_origin"],
+                best_transition["region"],
+                best_transition["product"],
+            ),
+            [],
         )
 
         # Remove best transition from ranking table
@@ -106,19 +108,20 @@ def get_best_asset_to_decommission_cement(
 
     # Select best asset to decommission from the list of candidates
     logger.debug(f"Candidates for decommissioning: {len(candidates)}")
+    candidates_by_origin = group_assets_by_transition_origin(candidates)
 
     best_candidates: list[Asset] = []
     while not best_candidates:
 
         best_transition = select_best_transition(df_rank_region)
 
-        best_candidates = list(
-            filter(
-                lambda asset: (asset.technology == best_transition["technology_origin"])
-                & (asset.region == best_transition["region"])
-                & (asset.product == best_transition["product"]),
-                candidates,
-            )
+        best_candidates = candidates_by_origin.get(
+            (
+                best_transition["technology_origin"],
+                best_transition["region"],
+                best_transition["product"],
+            ),
+            [],
         )
 
         # Remove best transition from ranking table
@@ -1,4 +1,4 @@
-""" Functions for cost calculations. """
+"""Functions for cost calculations."""
 
 import numpy as np
 import pandas as pd
@@ -19,9 +19,69 @@ def discount_costs(df_cost: pd.DataFrame, grouping_cols: list) -> pd.DataFrame:
     """
     # Calculate NPV over data groups with cost series across model time horizon
     logger.info("Calculate NPV")
+    df_npv = discount_annual_costs(df_cost, grouping_cols)
+    if df_npv is not None:
+        return df_npv
     return df_cost.groupby(grouping_cols).apply(calculate_npv_costs)
 
 
+def discount_annual_costs(
+    df_cost: pd.DataFrame, grouping_cols: list
+) -> pd.DataFrame | None:
+    """Calculate the same NPV as calculate_npv_costs for all groups at once with arrays instead of a row-wise apply.
+    Only possible if the cost data of each group are annual, i.e. the years increase by one from row to row, and the
+    lifetimes are whole numbers of years.
+
+    Args:
+        df_cost: contains columns "year", "carbon_cost_addition", "technology_lifetime" and "wacc"
+        grouping_cols: list of column headers for grouping of the cost data
+
+    Returns:
+        pd.DataFrame: column "carbon_cost_addition" with the NPV, indexed by grouping_cols and "year" (None if the
+            cost data are not annual)
+    """
+    df_cost = df_cost.dropna(subset=grouping_cols)
+    if df_cost.empty:
+        return None
+    group = df_cost.groupby(grouping_cols, sort=False).ngroup().to_numpy()
+
+    # Sort rows by group, keeping the order of the rows within each group
+    order = np.argsort(group, kind="stable")
+    group = group[order]
+    year = df_cost["year"].to_numpy()[order]
+    cost = df_cost["carbon_cost_addition"].to_numpy(dtype=float)[order]
+    rate = df_cost["wacc"].to_numpy(dtype=float)[order]
+    lifetime = df_cost["technology_lifetime"].to_numpy(dtype=float)[order]
+
+    # Last row of each group
+    group_start = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+    group_end = np.r_[group_start[1:], len(group)] - 1
+    last_row = np.repeat(group_end, group_end - group_start + 1)
+
+    same_group = group[1:] == group[:-1]
+    if (
+        (np.diff(year)[same_group] != 1).any()
+        or (lifetime != np.round(lifetime)).any()
+        or (lifetime < 0).any()
+    ):
+        return None
+
+    # Cost in each year of the lifetime is discounted by its position in the lifetime, cost data are expanded with the
+    #   value of the last year beyond the model years
+    npv = np.zeros(len(cost))
+    for position in range(int(lifetime.max(initial=0)) + 1):
+        row = np.minimum(np.arange(len(cost)) + position, last_row)
+        discounted_cost = cost[row] / (1 + rate) ** position
+        npv += np.where(
+            (position <= lifetime) & ~np.isnan(discounted_cost), discounted_cost, 0
+        )
+
+    index = pd.MultiIndex.from_frame(
+        df_cost[grouping_cols + ["year"]].iloc[order].reset_index(drop=True)
+    )
+    return pd.DataFrame({"carbon_cost_addition": npv}, index=index)
+
+
 def calculate_npv_costs(df_cost: pd.DataFrame) -> pd.DataFrame:
     """Calculate net present value (NPV) of all cost columns in the DataFrame of costs.
 
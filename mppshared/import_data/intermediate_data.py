@@ -1,13 +1,66 @@
+import os
 import shutil
+import threading
 from pathlib import Path
 
 import pandas as pd
+
+try:
+    import python_calamine  # noqa: F401
+
+    # The Rust-based calamine engine parses workbooks much faster than the default engine openpyxl
+    _EXCEL_ENGINE = "calamine"
+except ImportError:  # optional dependency
+    _EXCEL_ENGINE = None
+
 from mppshared.config import LOG_LEVEL
 from mppshared.utility.utils import get_logger
 
 logger = get_logger(__name__)
 logger.setLevel(LOG_LEVEL)
 
+# Business case workbooks and their parsed sheets, shared by all importers in the process. Keyed by the path and
+#   modification time of the workbook, so that a changed workbook is parsed again
+_business_case_workbooks: dict = {}
+_business_case_sheets: dict = {}
+# Sheets may be parsed from several threads, but each workbook is only opened once
+_business_case_workbooks_lock = threading.Lock()
+
+
+def _reset_business_case_workbooks():
+    """Forget the workbooks opened by the parent process in a forked child process. The file handles of inherited
+    workbooks share their offset with the parent and all other children, so reading them in parallel corrupts the
+    data. The child opens the workbooks it needs again. The parsed sheets remain valid and are kept.
+    """
+    global _business_case_workbooks_lock
+    _business_case_workbooks.clear()
+    # The lock may have been held by another thread of the parent when the process was forked
+    _business_case_workbooks_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_reset_business_case_workbooks)
+
+
+def close_business_case_workbooks():
+    """Close all open business case workbooks, e.g. before worker processes are forked. The parsed sheets are kept and
+    the workbooks are opened again if another sheet is requested."""
+    with _business_case_workbooks_lock:
+        for workbook in _business_case_workbooks.values():
+            workbook.close()
+        _business_case_workbooks.clear()
+
+
+def _open_workbook(full_path: Path) -> pd.ExcelFile:
+    """Open an Excel workbook with the calamine engine if python-calamine is installed, else with the default engine."""
+    if _EXCEL_ENGINE is not None:
+        try:
+            return pd.ExcelFile(full_path, engine=_EXCEL_ENGINE)
+        except ValueError:
+            # pandas supports the calamine engine from version 2.2 onwards
+            logger.debug("Excel engine calamine not supported, using default engine")
+    return pd.ExcelFile(full_path)
+
 
 class IntermediateDataImporter:
     """Imports data that is output by the model at some point in time"""
@@ -40,13 +93,7 @@ class IntermediateDataImporter:
 
         # Export directory depends on whether a CarbonCostTrajectory is passed or not
         if carbon_cost_trajectory:
-            final_carbon_cost = int(
-                carbon_cost_trajectory.df_carbon_cost.loc[
-                    carbon_cost_trajectory.df_carbon_cost["year"]
-                    == carbon_cost_trajectory.end_year,
-                    "carbon_cost",
-                ].item()
-            )
+            final_carbon_cost = int(carbon_cost_trajectory.final_carbon_cost)
             self.export_dir = parent_path.joinpath(
                 f"{sector}/data/{pathway_name}/{sensitivity}/carbon_cost_{final_carbon_cost}"
             )
@@ -64,6 +111,7 @@ class IntermediateDataImporter:
         self.raw_path = parent_path.joinpath(
             f"{self.core_data_path}/01_business_case_raw"
         )
+        self.business_case_cache_path = self.raw_path.joinpath("cache")
         self.import_path = self.export_dir.joinpath("import")
         self.intermediate_path = self.export_dir.joinpath("intermediate")
         self.stack_tracker_path = self.export_dir.joinpath("stack_tracker")
@@ -112,6 +160,15 @@ class IntermediateDataImporter:
         )
 
     # imports & preprocessing
+    def get_business_case_workbook_key(self) -> tuple:
+        """Return the path and modification time of the business cases workbook (None if only its cache exists), which
+        identify the parsed business case data."""
+        full_path = self.raw_path.joinpath(self.business_case_excel_filename)
+        return (
+            full_path,
+            full_path.stat().st_mtime_ns if full_path.exists() else None,
+        )
+
     def get_raw_input_data(
         self,
         sheet_name: str,
@@ -126,19 +183,59 @@ class IntermediateDataImporter:
             excel_column_ranges ():
 
         Returns:
-            pd.DataFrame: Full data of sheet with correct header
+            pd.DataFrame: Full data of sheet with correct header (a copy that can be modified by the caller)
         """
 
-        filename = self.business_case_excel_filename
-        full_path = self.raw_path.joinpath(filename)
-        df = pd.read_excel(
-            full_path,
-            sheet_name=sheet_name,
-            header=header_business_case_excel,
-            usecols=excel_column_ranges[sheet_name],
+        # Open the workbook once and parse every sheet only once, even if it is requested for several metrics. Without
+        #   the workbook, the sheets exported to the cache are used
+        workbook_key = self.get_business_case_workbook_key()
+        full_path = workbook_key[0]
+        sheet_key = (
+            workbook_key,
+            sheet_name,
+            header_business_case_excel,
+            excel_column_ranges[sheet_name],
         )
+        if sheet_key not in _business_case_sheets:
+
+            # Parsed sheets are also kept on disk across runs until the workbook changes
+            cache_path = self.business_case_cache_path.joinpath(
+                "_".join(
+                    [
+                        full_path.stem,
+                        sheet_name,
+                        str(header_business_case_excel),
+                        excel_column_ranges[sheet_name].replace(":", "-"),
+                    ]
+                )
+                + ".pkl"
+            )
+            if cache_path.exists() and (
+                workbook_key[1] is None
+                or cache_path.stat().st_mtime_ns > workbook_key[1]
+            ):
+                df = pd.read_pickle(cache_path)
+            else:
+                with _business_case_workbooks_lock:
+                    if workbook_key not in _business_case_workbooks:
+                        _business_case_workbooks[workbook_key] = _open_workbook(
+                            full_path
+                        )
+                df = _business_case_workbooks[workbook_key].parse(
+                    sheet_name=sheet_name,
+                    header=header_business_case_excel,
+                    usecols=excel_column_ranges[sheet_name],
+                )
+                # Write to a temporary file first so that parallel runs never read a partially written cache
+                cache_path.parent.mkdir(exist_ok=True, parents=True)
+                temporary_path = cache_path.with_suffix(
+                    f".{os.getpid()}.{threading.get_ident()}.tmp"
+                )
+                df.to_pickle(temporary_path)
+                temporary_path.replace(cache_path)
+            _business_case_sheets[sheet_key] = df
 
-        return df
+        return _business_case_sheets[sheet_key].copy()
 
     def get_imported_input_data(
         self,
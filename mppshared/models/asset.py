@@ -4,6 +4,7 @@ from copy import deepcopy
 from uuid import uuid4
 from xmlrpc.client import Boolean
 
+import numpy as np
 import pandas as pd
 from mppshared.config import LOG_LEVEL
 from mppshared.utility.dataframe_utility import get_emission_columns
@@ -12,6 +13,28 @@ from mppshared.utility.utils import get_logger, get_unique_list_values
 logger = get_logger(__name__)
 logger.setLevel(LOG_LEVEL)
 
+# Asset attributes that AssetStack.update_asset changes
+UPDATED_ASSET_ATTRIBUTES = [
+    "technology",
+    "technology_classification",
+    "asset_lifetime",
+    "retrofit",
+    "rebuild",
+    "stay_same",
+    "year_commissioned",
+]
+
+# Fields of the structured array that packs the state of a list of Assets for vectorized scans. The string attributes
+#   are stored as integer codes that index into the categories returned by pack_assets
+PACKED_ASSET_DTYPE = np.dtype(
+    [
+        ("uuid", np.int32),
+        ("product", np.int16),
+        ("region", np.int16),
+        ("technology", np.int16),
+    ]
+)
+
 
 class Asset:
     """Define an asset that produces a specific product with a specific technology."""
@@ -111,6 +134,29 @@ def create_assets(n_assets: int, **kwargs) -> list:
     return [Asset(**kwargs) for _ in range(n_assets)]
 
 
+def pack_assets(assets: list) -> tuple[np.ndarray, dict]:
+    """Pack the state of Assets into a structured array with one record per Asset (same order as assets). The array is
+    a snapshot: changes to the Assets afterwards are not reflected in it.
+
+    Args:
+        assets: list of Assets, may contain the same Asset several times
+
+    Returns:
+        Structured array with dtype PACKED_ASSET_DTYPE, and dict with the codes of the values of each of its fields
+        (e.g., codes["technology"]["Natural Gas SMR"])
+    """
+    packed = np.empty(len(assets), dtype=PACKED_ASSET_DTYPE)
+    codes = {}
+    for field in PACKED_ASSET_DTYPE.names:
+        values, categories = pd.factorize(
+            np.array([getattr(asset, field) for asset in assets], dtype=object)
+        )
+        packed[field] = values
+        codes[field] = {value: code for code, value in enumerate(categories)}
+
+    return packed, codes
+
+
 class AssetStack:
     """Define an AssetStack composed of several Assets"""
 
@@ -127,6 +173,9 @@ class AssetStack:
         self.cuf_lower_threshold = cuf_lower_threshold
         # Keep track of all assets added this year
         self.new_ids: list[str] = []
+        # Annual production capacity and volume by product, summed in the order of the assets and shared by all
+        #   transitions in a year. Computed when first needed and reset whenever the assets change
+        self.production_totals: dict | None = None
 
     def __eq__(self, other):
         self_uuids = {asset.uuid for asset in self.assets}
@@ -136,11 +185,15 @@ class AssetStack:
     def remove(self, remove_asset: Asset):
         """Remove asset from stack"""
         self.assets = [asset for asset in self.assets if asset != remove_asset]
+        self.production_totals = None
 
     def append(self, new_asset: Asset):
         """Add new asset to stack"""
         self.assets.append(new_asset)
         self.new_ids.append(new_asset.uuid)
+        # The new asset is last in the order of the assets, so it can be added to the production totals
+        if self.production_totals is not None:
+            self._add_to_production_totals(new_asset)
 
     def update_asset(
         self,
@@ -168,6 +221,8 @@ class AssetStack:
                 (new_technology == origin_technology) & (switch_type == brownfield_renovation))
 
         Returns:
+            dict with the asset's position in the stack and its attributes before the update, to be passed to
+                revert_asset_update
 
         """
 
@@ -175,6 +230,19 @@ class AssetStack:
         len_pre = len(self.assets)
 
         uuid_update = asset_to_update.uuid
+        position = next(
+            i for i, asset in enumerate(self.assets) if asset.uuid == uuid_update
+        )
+        undo = {
+            "asset": asset_to_update,
+            "position": position,
+            "production_totals": self.production_totals,
+            "attributes": {
+                attribute: getattr(asset_to_update, attribute)
+                for attribute in UPDATED_ASSET_ATTRIBUTES
+            },
+        }
+
         asset_to_update.technology = new_technology
         asset_to_update.technology_classification = new_classification
         asset_to_update.asset_lifetime = asset_lifetime
@@ -195,14 +263,46 @@ class AssetStack:
             ):
                 asset_to_update.year_commissioned = year
 
-        self.assets = [asset for asset in self.assets if asset.uuid != uuid_update]
+        self.assets.pop(position)
         self.assets.append(asset_to_update)
+        self.production_totals = None
 
         # check to make sure that number of assets does not change
         assert len_pre == len(
             self.assets
         ), "Function update_asset has changed the number of assets in the stack!"
 
+        return undo
+
+    def revert_asset_update(self, undo: dict):
+        """Revert an update of an asset in the AssetStack, e.g. after checking the constraints for a tentative
+        technology transition in place instead of on a copy of the AssetStack.
+
+        Args:
+            undo: dict returned by update_asset
+        """
+        asset = undo["asset"]
+        for attribute, value in undo["attributes"].items():
+            setattr(asset, attribute, value)
+
+        # Move the asset back to its position before the update
+        self.assets.remove(asset)
+        self.assets.insert(undo["position"], asset)
+        self.production_totals = undo["production_totals"]
+
+    def reset_production_totals(self):
+        """Reset the annual production capacity and volume by product. Needs to be called after changing the capacity or
+        CUF of an asset in the AssetStack directly."""
+        self.production_totals = None
+
+    def _add_to_production_totals(self, asset: Asset):
+        """Add the annual production capacity and volume of an asset to the totals of its product."""
+        capacity, volume = self.production_totals.get(asset.product, (0, 0))  # type: ignore
+        self.production_totals[asset.product] = (  # type: ignore
+            capacity + asset.get_annual_production_capacity(),
+            volume + asset.get_annual_production_volume(),
+        )
+
     def empty(self) -> Boolean:
         """Return True if no asset in stack"""
         return not self.assets
@@ -246,21 +346,48 @@ class AssetStack:
     ) -> float:
         """Get annual production capacity of the AssetStack for a specific product,
         optionally filtered by region and technology"""
-        assets = self.filter_assets(
-            product=product, region=region, technology=technology
+        if product is not None and region is None and technology is None:
+            return self._get_production_totals(product)[0]
+        return sum(
+            asset.get_annual_production_capacity()
+            for asset in self._iter_assets(
+                product=product, region=region, technology=technology
+            )
         )
-        return sum(asset.get_annual_production_capacity() for asset in assets)
 
     def get_annual_production_volume(
         self, product, region=None, technology=None
     ) -> float:
         """Get the yearly production volume of the AssetStack for a specific product,
         optionally filtered by region and technology"""
-
-        assets = self.filter_assets(
-            product=product, region=region, technology=technology
+        if product is not None and region is None and technology is None:
+            return self._get_production_totals(product)[1]
+        return sum(
+            asset.get_annual_production_volume()
+            for asset in self._iter_assets(
+                product=product, region=region, technology=technology
+            )
         )
-        return sum(asset.get_annual_production_volume() for asset in assets)
+
+    def _get_production_totals(self, product) -> tuple:
+        """Get annual production capacity and volume of a product, computing the totals of all products in a single
+        pass over the assets if they have been reset"""
+        if self.production_totals is None:
+            self.production_totals = {}
+            for asset in self.assets:
+                self._add_to_production_totals(asset)
+        return self.production_totals.get(product, (0, 0))
+
+    def _iter_assets(self, product=None, region=None, technology=None):
+        """Iterate over the assets with the given product, region and technology in a single pass (same order as
+        filter_assets, without building intermediate lists)"""
+        for asset in self.assets:
+            if (
+                (product is None or asset.product == product)
+                and (region is None or asset.region == region)
+                and (technology is None or asset.technology == technology)
+            ):
+                yield asset
 
     def log_annual_production_volume_by_region_and_tech(self, product: str):
         """Only in debug logger mode: logs production volumes per region and technology"""
@@ -312,28 +439,27 @@ class AssetStack:
             technology_classification=technology_classification, product=product
         )
 
-        # Aggregate stack to DataFrame
+        # There are no assets
+        if not assets:
+            return pd.DataFrame()
+
+        # Aggregate stack to DataFrame, built column by column from arrays instead of one dict per asset
+        capacity = np.array([asset.annual_production_capacity for asset in assets])
+        cuf = np.array([asset.cuf for asset in assets])
         df = pd.DataFrame(
-            [
-                {
-                    "product": asset.product,
-                    "technology": asset.technology,
-                    "region": asset.region,
-                    "annual_production_capacity": asset.get_annual_production_capacity(),
-                    "annual_production_volume": asset.get_annual_production_volume(),
-                }
-                for asset in assets
-            ]
+            {
+                "product": [asset.product for asset in assets],
+                "technology": [asset.technology for asset in assets],
+                "region": [asset.region for asset in assets],
+                "annual_production_capacity": capacity,
+                "annual_production_volume": capacity * cuf,
+            }
+        )
+        return df.groupby(aggregation_vars).agg(
+            annual_production_capacity=("annual_production_capacity", "sum"),
+            annual_production_volume=("annual_production_volume", "sum"),
+            number_of_assets=("annual_production_capacity", "count"),
         )
-        try:
-            return df.groupby(aggregation_vars).agg(
-                annual_production_capacity=("annual_production_capacity", "sum"),
-                annual_production_volume=("annual_production_volume", "sum"),
-                number_of_assets=("annual_production_capacity", "count"),
-            )
-        except KeyError:
-            # There are no assets
-            return pd.DataFrame()
 
     def calculate_emissions_stack(
         self,
@@ -29,6 +29,12 @@ class CarbonCostTrajectory:
             end_year=end_year,
         )
 
+        # Carbon cost by position of the year in model_years, which are contiguous
+        self._carbon_cost_by_year = self.df_carbon_cost["carbon_cost"].to_numpy()
+
+        # Carbon cost in the end year (used to name the export directories of the carbon cost runs)
+        self.final_carbon_cost = self.get_carbon_cost(self.end_year)
+
     def set_carbon_cost(
         self,
         trajectory: str,
@@ -76,4 +82,8 @@ class CarbonCostTrajectory:
         return df_carbon_cost
 
     def get_carbon_cost(self, year: int) -> float:
-        return self.df_carbon_cost.set_index("year").loc[year, "carbon_cost"]
+        # Negative positions would wrap around to the end of the trajectory
+        position = year - self.model_years[0]
+        if not 0 <= position < len(self._carbon_cost_by_year):
+            raise KeyError(year)
+        return float(self._carbon_cost_by_year[position])
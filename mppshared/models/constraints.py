@@ -96,6 +96,38 @@ def check_constraints(
     return constraints_checked
 
 
+def is_constraint_affected_by_technology(
+    pathway: SimulationPathway, constraint: str, technology: str
+) -> bool:
+    """Check whether the assets of a technology enter the check of a constraint. A technology transition between two
+    technologies that do not affect a constraint cannot change whether the constraint is fulfilled.
+
+    Args:
+        pathway: contains the technologies with a maximum global demand share and the emissions of each technology
+        constraint: constraint as in pathway.constraints_to_apply
+        technology: origin or destination technology of a transition
+
+    Returns:
+        False if the constraint only depends on other technologies, True otherwise (also for constraints that depend
+            on all technologies)
+    """
+    if constraint == "electrolysis_capacity_addition_constraint":
+        return "Electrolyser" in technology
+
+    if constraint == "demand_share_constraint":
+        return technology in pathway.technologies_maximum_global_demand_share  # type: ignore
+
+    if constraint == "co2_storage_constraint":
+        # Assets only count towards CO2 storage if their technology captures CO2 in some product, region or year
+        df_emissions = pathway.emissions.reset_index()
+        df_emissions = df_emissions.loc[
+            df_emissions["technology"] == technology, "co2_scope1_captured"
+        ]
+        return bool((df_emissions.fillna(0) != 0).any())
+
+    return True
+
+
 def check_technology_rampup_constraint(
     pathway: SimulationPathway,
     stack: AssetStack,
@@ -295,6 +327,9 @@ def check_global_demand_share_constraint(
     ).reset_index()
     constraint = True
 
+    # Maximum global demand share is indexed by the position of the year in the model horizon
+    maximum_share = pathway.maximum_global_demand_share[year - pathway.start_year]  # type: ignore
+
     for technology in pathway.technologies_maximum_global_demand_share:  # type: ignore
 
         # Calculate annual production volume based on CUF upper threshold
@@ -311,7 +346,7 @@ def check_global_demand_share_constraint(
         df["demand"] = df["product"].apply(
             lambda x: pathway.get_demand(product=x, year=year, region="Global")
         )
-        df["demand_maximum"] = pathway.maximum_global_demand_share[year] * df["demand"]  # type: ignore
+        df["demand_maximum"] = maximum_share * df["demand"]
 
         # Compare
         df["check"] = np.where(
@@ -433,19 +468,17 @@ def convert_production_volume_to_electrolysis_capacity(
         / (365 * 24 * df_stack["electrolyser_capacity_factor"])
     )
 
-    def choose_ratio(row: pd.Series) -> float:
-        if row["product"] == "Ammonia":
-            ratio = H2_PER_AMMONIA  # tH2/tNH3
-        elif row["product"] == "Urea":
-            ratio = H2_PER_AMMONIA * AMMONIA_PER_UREA
-        elif row["product"] == "Ammonium nitrate":
-            ratio = H2_PER_AMMONIA * AMMONIA_PER_AMMONIUM_NITRATE
-        return ratio
+    # Ratio of hydrogen to product
+    h2_per_product = {
+        "Ammonia": H2_PER_AMMONIA,  # tH2/tNH3
+        "Urea": H2_PER_AMMONIA * AMMONIA_PER_UREA,
+        "Ammonium nitrate": H2_PER_AMMONIA * AMMONIA_PER_AMMONIUM_NITRATE,
+    }
 
     # Electrolysis capacity in GW
-    df_stack["electrolysis_capacity"] = df_stack.apply(
-        lambda row: row["electrolysis_capacity"] * choose_ratio(row), axis=1
-    )
+    df_stack["electrolysis_capacity"] = df_stack["electrolysis_capacity"] * df_stack[
+        "product"
+    ].map(h2_per_product).astype(float)
 
     return df_stack
 
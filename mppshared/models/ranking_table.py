@@ -0,0 +1,83 @@
+""" Class that describes a ranking table of technology transitions from which transitions are selected and removed."""
+import numpy as np
+import pandas as pd
+
+
+class RankingTable:
+    """Ranking table of technology transitions that keeps track of the remaining transitions with a boolean mask
+    instead of creating a new DataFrame for every transition that is removed.
+    """
+
+    def __init__(self, df_rank: pd.DataFrame, rng: np.random.Generator | None = None):
+        """
+        Args:
+            df_rank: contains column "rank" with ranking for each technology transition (minimum rank = optimal
+                technology transition) and columns "technology_origin", "technology_destination"
+            rng: random number generator to choose between transitions with the same rank (randomly seeded if None)
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        self.df_rank = df_rank.reset_index(drop=True)
+        self.rank = self.df_rank["rank"].to_numpy()
+        self.technology_origin = self.df_rank["technology_origin"].to_numpy()
+        self.technology_destination = self.df_rank["technology_destination"].to_numpy()
+
+        # Identical rows are removed together
+        self.row_group = (
+            self.df_rank.groupby(
+                list(self.df_rank.columns), sort=False, dropna=False, observed=True
+            )
+            .ngroup()
+            .to_numpy()
+        )
+        self.alive = np.ones(len(self.df_rank), dtype=bool)
+
+        # Sort the transitions by rank once, with transitions of the same rank in random order. The best remaining
+        #   transition is then the first one in that order that has not been removed
+        self.order = np.lexsort((rng.random(len(self.df_rank)), self.rank))
+        self.position = 0
+
+    def _skip_removed_transitions(self):
+        """Move the position in the sorted transitions to the first transition that has not been removed"""
+        while (
+            self.position < self.order.size
+            and not self.alive[self.order[self.position]]
+        ):
+            self.position += 1
+
+    def empty(self) -> bool:
+        """Return True if no transition is left in the ranking table"""
+        self._skip_removed_transitions()
+        return self.position == self.order.size
+
+    def select_best_transition(self) -> tuple:
+        """Select the best transition among the remaining transitions
+
+        Returns:
+            Row index of the best transition in the ranking table and the best transition as dict
+        """
+        # Best transition has minimum rank (if same rank, chosen randomly)
+        self._skip_removed_transitions()
+        index = self.order[self.position]
+        return index, self.df_rank.iloc[[index]].to_dict(orient="records")[0]
+
+    def remove_transition(self, index: int):
+        """Remove specific transition from ranking table.
+
+        Args:
+            index: row index of the transition in the ranking table
+        """
+        self.alive &= self.row_group != self.row_group[index]
+
+    def remove_all_transitions_with_destination_technology(
+        self, technology_destination: str
+    ):
+        """Remove all transitions with a specific destination technology from the ranking table (except for switches
+        with equal origin and destination tech).
+
+        Args:
+            technology_destination: destination technology of the transitions to be removed
+        """
+        self.alive &= ~(
+            (self.technology_destination == technology_destination)
+            & (self.technology_origin != self.technology_destination)
+        )
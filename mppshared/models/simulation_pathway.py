@@ -1,5 +1,6 @@
 from collections import defaultdict
-from copy import deepcopy
+from concurrent.futures import Executor
+from copy import copy, deepcopy
 
 import numpy as np
 import pandas as pd
@@ -10,7 +11,7 @@ from mppshared.models.asset import Asset, AssetStack, create_assets
 from mppshared.models.carbon_budget import CarbonBudget
 from mppshared.models.carbon_cost_trajectory import CarbonCostTrajectory
 from mppshared.models.transition import TransitionRegistry
-from mppshared.utility.dataframe_utility import flatten_columns
+from mppshared.utility.dataframe_utility import flatten_columns, set_datatypes
 from mppshared.utility.utils import get_logger
 from plotly.offline import plot
 from plotly.subplots import make_subplots
@@ -49,7 +50,8 @@ class SimulationPathway:
         set_biomass_constraint: bool = False,
         carbon_cost_trajectory: CarbonCostTrajectory | None = None,
         technologies_maximum_global_demand_share: list | None = None,
-        maximum_global_demand_share: dict | None = None,
+        maximum_global_demand_share: np.ndarray | None = None,
+        categorical_dtypes: dict | None = None,
     ):
         # Attributes describing the pathway
         self.start_year = start_year
@@ -111,6 +113,9 @@ class SimulationPathway:
         # Import demand for all regions
         logger.debug("Getting demand")
         self.demand = self.importer.get_demand(region=None)
+        if categorical_dtypes:
+            # Demand is looked up by product and region many times per year, categoricals make these filters cheaper
+            self.demand = set_datatypes(self.demand, categorical_dtypes)
 
         # Import ranking of technology transitions for all transition types
         logger.debug("Getting rankings")
@@ -139,11 +144,17 @@ class SimulationPathway:
         for rank_type in self.rank_types:
             df_rank = self.importer.get_ranking(rank_type=rank_type)
 
-            rankings[rank_type] = {}
-            for year in range(self.start_year, self.end_year + 1):
-                rankings[rank_type][year] = df_rank.query(f"year == {year}")
+            rankings[rank_type] = self._split_ranking_by_year(df_rank)
         return rankings
 
+    def _split_ranking_by_year(self, df_rank: pd.DataFrame) -> dict:
+        """Split a ranking into one DataFrame for each year of the model horizon in a single pass"""
+        rankings_by_year = dict(iter(df_rank.groupby("year", sort=False)))
+        return {
+            year: rankings_by_year.get(year, df_rank.iloc[0:0])
+            for year in range(self.start_year, self.end_year + 1)
+        }
+
     def save_rankings(self):
         """Save rankings for all products to .csv files"""
         for product in self.products:
@@ -182,9 +193,22 @@ class SimulationPathway:
             export_dir="final/All",
         )
 
-    def export_stack_to_csv(self, year):
+    def export_stack_to_csv(self, year, executor: Executor | None = None):
+        """Export the AssetStack of a year to csv. If an executor is passed, the stack is exported to a DataFrame
+        immediately and the csv is written in the background; the Future of the write is returned."""
         df = self.get_stack(year).export_stack_to_df()
-        self.importer.export_data(df, f"stack_{year}.csv", "stack_tracker", index=False)
+        if executor is None:
+            self.importer.export_data(
+                df, f"stack_{year}.csv", "stack_tracker", index=False
+            )
+            return None
+        return executor.submit(
+            self.importer.export_data,
+            df,
+            f"stack_{year}.csv",
+            "stack_tracker",
+            index=False,
+        )
 
     def output_technology_roadmap(self, technology_layout: dict | None = None):
         logger.debug("Creating technology roadmap")
@@ -373,7 +397,8 @@ class SimulationPathway:
         return df[(df[("product", "")] == product) & (df[("year", "")] == year)]
 
     def get_ranking(self, year, rank_type):
-        """Get ranking df for a specific year/product"""
+        """Get ranking df for a specific year/product. The rankings are split by year once when the pathway is
+        created, so the same DataFrame is returned for every call and must not be modified in place."""
         if rank_type not in self.rank_types:
             raise ValueError(
                 "Rank type %s not recognized, choose one of %s",
@@ -383,6 +408,52 @@ class SimulationPathway:
 
         return self.rankings[rank_type][year]
 
+    def filter_rankings(self, rank_type: str, filter_function, **kwargs):
+        """Apply a filter that does not depend on the year to the ranking of a rank type in all years at once
+
+        Args:
+            rank_type: rank type of the rankings to be filtered
+            filter_function: function that takes the ranking DataFrame as first argument and returns it filtered
+            **kwargs: further arguments passed to filter_function
+        """
+        df_rank = filter_function(
+            pd.concat(self.rankings[rank_type].values()), **kwargs
+        )
+        self.rankings[rank_type] = self._split_ranking_by_year(df_rank)
+
+    def categorize_rankings(self, rank_types: list):
+        """Cast the product, region and technology columns of the rankings of several rank types to categoricals that
+        are shared across all years. Origin and destination technologies share the same categories so that they can be
+        compared with each other.
+
+        Args:
+            rank_types: rank types of the rankings to be cast
+        """
+        df_ranks = [
+            df_rank
+            for rank_type in rank_types
+            for df_rank in self.rankings[rank_type].values()
+        ]
+
+        def get_categories(cols: list) -> pd.CategoricalDtype:
+            values = pd.concat([df_rank[col] for df_rank in df_ranks for col in cols])
+            return pd.CategoricalDtype(sorted(values.dropna().unique()))
+
+        technology_dtype = get_categories(
+            ["technology_origin", "technology_destination"]
+        )
+        dtypes = {
+            "product": get_categories(["product"]),
+            "region": get_categories(["region"]),
+            "technology_origin": technology_dtype,
+            "technology_destination": technology_dtype,
+        }
+        for rank_type in rank_types:
+            self.rankings[rank_type] = {
+                year: df_rank.astype(dtypes)
+                for year, df_rank in self.rankings[rank_type].items()
+            }
+
     def update_ranking(self, df_rank, product, year, rank_type):
         """Update ranking for a product, year, type"""
         self.rankings[product][rank_type][year] = df_rank
@@ -430,8 +501,10 @@ class SimulationPathway:
     def copy_stack(self, year: int):
         """Copy this year's stack to next year"""
         old_stack = self.get_stack(year=year)
+        # Assets only hold scalars and the emission_scopes and ghgs lists, which are never modified in place, so a
+        # shallow copy of each asset keeps the stacks of the two years independent at a fraction of the cost of deepcopy
         new_stack = AssetStack(
-            assets=deepcopy(old_stack.assets),
+            assets=[copy(asset) for asset in old_stack.assets],
             emission_scopes=deepcopy(old_stack.emission_scopes),
             ghgs=deepcopy(old_stack.ghgs),
             cuf_lower_threshold=deepcopy(old_stack.cuf_lower_threshold),
@@ -1,14 +1,15 @@
 """ Create outputs for debugging."""
-from collections import defaultdict
+from itertools import chain
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
 from mppshared.config import EMISSION_SCOPES_DEFAULT, LOG_LEVEL
 from mppshared.import_data.intermediate_data import IntermediateDataImporter
+from mppshared.utility.dataframe_utility import categorize_columns
 from mppshared.utility.log_utility import get_logger
 from pandas import CategoricalDtype
-from plotly.offline import plot
 from plotly.subplots import make_subplots
 
 logger = get_logger(__name__)
@@ -32,10 +33,13 @@ def create_debugging_outputs(
         products=products,
     )
 
+    # Load the asset stacks once and reuse them for all outputs
+    stacks = _load_asset_stacks(importer, start_year=start_year, end_year=end_year)
+
     # Create summary table of asset transitions
     logger.info("Creating table with asset transition sequences.")
     df_transitions = create_table_asset_transition_sequences(
-        importer, start_year=start_year, end_year=end_year
+        importer, start_year=start_year, end_year=end_year, stacks=stacks
     )
     importer.export_data(
         df_transitions,
@@ -98,11 +102,13 @@ def create_debugging_outputs(
         importer=importer,
         start_year=start_year,
         end_year=end_year,
+        stacks=stacks,
     )
     output_technology_roadmap(
         importer=importer,
         start_year=start_year,
         end_year=end_year,
+        stacks=stacks,
     )
 
 
@@ -115,62 +121,45 @@ def output_renovation_transitions_by_year(
     technology_type: str = "origin",
 ):
     """Plot origin or destination technologies of renovation transitions by year."""
-    df_transitions = df_transitions.reset_index(drop=False).set_index("uuid")
-    df_transitions_renovation_status = df_transitions.loc[
-        df_transitions["parameter"] == f"{renovation_type}_status"
-    ]
-    renovation_techs: defaultdict = defaultdict()
-
-    # Iterate over every year and create dictionary of newbuild technologies in that year (no newbuild in 2020)
-    for year in np.arange(start_year, end_year):
-        renovation_cond1 = (
-            df_transitions.loc[
-                df_transitions["parameter"] == f"{renovation_type}_status", year
-            ]
-            == False
-        )
-        renovation_cond2 = (
-            df_transitions.loc[
-                df_transitions["parameter"] == f"{renovation_type}_status", year + 1
-            ]
-            == True
-        )
-        renovation_uuids = df_transitions_renovation_status.loc[
-            renovation_cond1 & renovation_cond2
-        ].index.unique()
-        renovation_df = df_transitions.loc[
-            (df_transitions.index.isin(renovation_uuids))
-            & (df_transitions["parameter"] == "technology")
-        ]
-        if technology_type == "origin":
-            renovation_techs[year + 1] = list(renovation_df[year])
-        else:
-            renovation_techs[year + 1] = list(renovation_df[year + 1])
-
-    # Create DataFrame from dictionary with technologies as index
-    df = pd.DataFrame.from_dict(renovation_techs, orient="index")
-    df = df.transpose()
-
-    technologies = {
-        value for value_list in renovation_techs.values() for value in value_list
-    }
-    df_agg = pd.DataFrame(index=technologies)
-    df_agg.index.rename("technology", inplace=True)
-    for year in renovation_techs.keys():
-        for technology in df_agg.index:
-            df_agg.loc[df_agg.index == technology, year] = renovation_techs[year].count(
-                technology
-            )
-
-    # Melt to long format and plot barchart
-    df_agg = df_agg.reset_index(drop=False).melt(
-        id_vars="technology", var_name="year", value_name="number"
+    years = np.arange(start_year, end_year + 1)
+
+    # Renovation status and technology of every asset (rows by uuid) in every year (columns)
+    parameters = df_transitions.index.get_level_values("parameter")
+    status = df_transitions.loc[
+        parameters == f"{renovation_type}_status", years
+    ].droplevel(["product", "region", "parameter"])
+    technologies = (
+        df_transitions.loc[parameters == "technology", years]
+        .droplevel(["product", "region", "parameter"])
+        .reindex(status.index)
+        .to_numpy()
+    )
+    status = status.to_numpy()
+
+    # Renovations switch the status from False to True between two consecutive years (no renovation in start_year)
+    is_renovation = (status[:, :-1] == False) & (status[:, 1:] == True)
+    if technology_type == "origin":
+        technologies = technologies[:, :-1]
+    else:
+        technologies = technologies[:, 1:]
+
+    # Create dictionary of renovated technologies in every year
+    renovation_techs = _collect_transitions_by_year(
+        is_renovation, technologies, years[1:]
     )
-    df_agg = df_agg.loc[df_agg["number"] > 0]
-    fig = make_subplots()
-    bar_fig = px.bar(df_agg, x="year", y="number", color="technology", text_auto=True)
 
-    fig.add_traces(bar_fig.data)
+    # Count the technologies in each year in long format and plot barchart
+    df_agg = _count_values_by_year(renovation_techs, value_name="technology")
+    fig = make_subplots()
+    for technology, df_tech in df_agg.groupby("technology"):
+        fig.add_trace(
+            go.Bar(
+                x=df_tech["year"],
+                y=df_tech["number"],
+                name=technology,
+                text=df_tech["number"],
+            )
+        )
     fig.update_layout(barmode="stack")
 
     fig.layout.xaxis.title = "Year"
@@ -179,13 +168,14 @@ def output_renovation_transitions_by_year(
         f"Brownfield {renovation_type}: {technology_type} technology (# of plants)"
     )
 
-    plot(
+    pio.write_html(
         fig,
-        filename=str(
+        file=str(
             importer.final_path.joinpath(
                 f"{renovation_type}_{technology_type}_technologies_by_year.html"
             )
         ),
+        include_plotlyjs="cdn",
         auto_open=False,
     )
     pass
@@ -199,55 +189,43 @@ def create_newbuild_capacity_outputs_by_region(
 ):
     """Show newbuild capacity by region"""
 
-    df_transitions = df_transitions.reset_index(drop=False)
-    newbuild_regions: defaultdict = defaultdict()
-
-    # Iterate over every year and create dictionary of newbuild technologies in that year (no newbuild in 2020)
-    for year in np.arange(start_year, end_year):
-        newbuild_cond1 = df_transitions[year].isna()
-        newbuild_cond2 = df_transitions[year + 1].notna()
-        newbuild_uuids = df_transitions.loc[
-            newbuild_cond1 & newbuild_cond2, "uuid"
-        ].unique()
-        newbuild_df = df_transitions.loc[
-            (df_transitions["uuid"].isin(newbuild_uuids))
-            & (df_transitions["parameter"] == "technology")
-        ]
-        newbuild_regions[year + 1] = list(newbuild_df["region"])
+    years = np.arange(start_year, end_year + 1)
 
-    # Create DataFrame from dictionary with technologies as index
-    df = pd.DataFrame.from_dict(newbuild_regions, orient="index")
-    df = df.transpose()
+    # Assets are built in the first year in which their technology is not missing (no newbuild in start_year)
+    df_technology = df_transitions.loc[
+        df_transitions.index.get_level_values("parameter") == "technology"
+    ].reset_index()
+    exists = df_technology[years].notna().to_numpy()
+    is_newbuild = ~exists[:, :-1] & exists[:, 1:]
+    regions = np.broadcast_to(
+        df_technology["region"].to_numpy()[:, np.newaxis], is_newbuild.shape
+    )
 
-    regions = {
-        value for value_list in newbuild_regions.values() for value in value_list
-    }
-    df_agg = pd.DataFrame(index=regions)
-    df_agg.index.rename("region", inplace=True)
-    for year in newbuild_regions.keys():
-        for technology in df_agg.index:
-            df_agg.loc[df_agg.index == technology, year] = newbuild_regions[year].count(
-                technology
-            )
+    # Create dictionary of newbuild regions in every year
+    newbuild_regions = _collect_transitions_by_year(is_newbuild, regions, years[1:])
 
-    # Melt to long format and plot barchart
-    df_agg = df_agg.reset_index(drop=False).melt(
-        id_vars="region", var_name="year", value_name="number"
-    )
-    df_agg = df_agg.loc[df_agg["number"] > 0]
+    # Count the regions in each year in long format and plot barchart
+    df_agg = _count_values_by_year(newbuild_regions, value_name="region")
     fig = make_subplots()
-    bar_fig = px.bar(df_agg, x="year", y="number", color="region", text_auto=True)
-
-    fig.add_traces(bar_fig.data)
+    for region, df_region in df_agg.groupby("region"):
+        fig.add_trace(
+            go.Bar(
+                x=df_region["year"],
+                y=df_region["number"],
+                name=region,
+                text=df_region["number"],
+            )
+        )
     fig.update_layout(barmode="stack")
 
     fig.layout.xaxis.title = "Year"
     fig.layout.yaxis.title = "Newbuild capacity (# of plants)"
     fig.layout.title = "Newbuild capacity by region"
 
-    plot(
+    pio.write_html(
         fig,
-        filename=str(importer.final_path.joinpath(f"newbuild_capacity_by_region.html")),
+        file=str(importer.final_path.joinpath(f"newbuild_capacity_by_region.html")),
+        include_plotlyjs="cdn",
         auto_open=False,
     )
 
@@ -260,139 +238,167 @@ def create_newbuild_capacity_outputs_by_technology(
 ):
     """Show newbuild capacity by technology for every year, in stacked bar chart."""
 
-    df_transitions = df_transitions.reset_index(drop=False)
-    newbuild_techs: defaultdict = defaultdict()
-
-    # Iterate over every year and create dictionary of newbuild technologies in that year (no newbuild in 2020)
-    for year in np.arange(start_year, end_year):
-        newbuild_cond1 = df_transitions[year].isna()
-        newbuild_cond2 = df_transitions[year + 1].notna()
-        newbuild_uuids = df_transitions.loc[
-            newbuild_cond1 & newbuild_cond2, "uuid"
-        ].unique()
-        newbuild_df = df_transitions.loc[
-            (df_transitions["uuid"].isin(newbuild_uuids))
-            & (df_transitions["parameter"] == "technology")
-        ]
-        newbuild_techs[year + 1] = list(newbuild_df[year + 1])
+    years = np.arange(start_year, end_year + 1)
 
-    # Create DataFrame from dictionary with technologies as index
-    df = pd.DataFrame.from_dict(newbuild_techs, orient="index")
-    df = df.transpose()
+    # Assets are built in the first year in which their technology is not missing (no newbuild in start_year)
+    df_technology = df_transitions.loc[
+        df_transitions.index.get_level_values("parameter") == "technology"
+    ].reset_index()
+    exists = df_technology[years].notna().to_numpy()
+    is_newbuild = ~exists[:, :-1] & exists[:, 1:]
+    technologies = df_technology[years].to_numpy()[:, 1:]
 
-    technologies = {
-        value for value_list in newbuild_techs.values() for value in value_list
-    }
-    df_agg = pd.DataFrame(index=technologies)
-    df_agg.index.rename("technology", inplace=True)
-    for year in newbuild_techs.keys():
-        for technology in df_agg.index:
-            df_agg.loc[df_agg.index == technology, year] = newbuild_techs[year].count(
-                technology
-            )
+    # Create dictionary of newbuild technologies in every year
+    newbuild_techs = _collect_transitions_by_year(is_newbuild, technologies, years[1:])
 
-    # Melt to long format and plot barchart
-    df_agg = df_agg.reset_index(drop=False).melt(
-        id_vars="technology", var_name="year", value_name="number"
-    )
-    df_agg = df_agg.loc[df_agg["number"] > 0]
+    # Count the technologies in each year in long format and plot barchart
+    df_agg = _count_values_by_year(newbuild_techs, value_name="technology")
     fig = make_subplots()
-    bar_fig = px.bar(df_agg, x="year", y="number", color="technology", text_auto=True)
-
-    fig.add_traces(bar_fig.data)
+    for technology, df_tech in df_agg.groupby("technology"):
+        fig.add_trace(
+            go.Bar(
+                x=df_tech["year"],
+                y=df_tech["number"],
+                name=technology,
+                text=df_tech["number"],
+            )
+        )
     fig.update_layout(barmode="stack")
 
     fig.layout.xaxis.title = "Year"
     fig.layout.yaxis.title = "Newbuild capacity (# of plants)"
     fig.layout.title = f"Newbuild capacity by technology"
 
-    plot(
+    pio.write_html(
         fig,
-        filename=str(
-            importer.final_path.joinpath(f"newbuild_capacity_by_technology.html")
-        ),
+        file=str(importer.final_path.joinpath(f"newbuild_capacity_by_technology.html")),
+        include_plotlyjs="cdn",
         auto_open=False,
     )
 
 
+def _collect_transitions_by_year(
+    is_transition: np.ndarray, values: np.ndarray, years: np.ndarray
+) -> dict:
+    """Collect the values at the transitions of every year in a single pass over the transition matrix.
+
+    Args:
+        is_transition (np.ndarray): boolean matrix with assets as rows and years as columns, True for a transition
+        values (np.ndarray): matrix of the same shape with the value (e.g., technology) of every asset in every year
+        years (np.ndarray): years of the columns
+
+    Returns:
+        dict: years as keys, lists of the values at the transitions in that year as values
+    """
+    # Transitions of the transposed matrix are ordered by year, so every year is one slice of the transitions
+    year_idx, asset_idx = np.nonzero(is_transition.T)
+    transition_values = values.T[year_idx, asset_idx]
+    bounds = np.searchsorted(year_idx, np.arange(1, len(years)))
+    return {
+        year: year_values.tolist()
+        for year, year_values in zip(years, np.split(transition_values, bounds))
+    }
+
+
+def _count_values_by_year(values_by_year: dict, value_name: str) -> pd.DataFrame:
+    """Count how often each value occurs in each year with a single groupby instead of counting value by value.
+
+    Args:
+        values_by_year (dict): years as keys, lists of values (e.g., technologies) as values
+        value_name (str): name of the column with the values
+
+    Returns:
+        pd.DataFrame: columns value_name, "year" and "number" with the count of every value that occurs in a year
+    """
+    # Flat columns of the years and values, one row per occurrence
+    df_long = pd.DataFrame(
+        {
+            "year": np.repeat(
+                list(values_by_year.keys()),
+                [len(values) for values in values_by_year.values()],
+            ),
+            value_name: list(chain.from_iterable(values_by_year.values())),
+        }
+    )
+    return df_long.groupby([value_name, "year"]).size().reset_index(name="number")
+
+
+def _load_asset_stacks(
+    importer: IntermediateDataImporter, start_year: int, end_year: int
+) -> dict:
+    """Load the asset stacks of all years between start_year and end_year.
+
+    Args:
+        importer (IntermediateDataImporter): importer of the pathway
+        start_year (int): first year
+        end_year (int): last year
+
+    Returns:
+        dict: years as keys, asset stacks with categorical product, region and technology as values
+    """
+    # Bind the getter once for the loop over all years
+    get_asset_stack = importer.get_asset_stack
+    stacks = {
+        year: get_asset_stack(year=year) for year in np.arange(start_year, end_year + 1)
+    }
+
+    # Categorical keys with shared categories make the groupbys over the stacks of all years hash integer codes
+    return categorize_columns(stacks, ["product", "region", "technology"])
+
+
 def create_table_asset_transition_sequences(
     importer: IntermediateDataImporter,
     start_year: int,
     end_year: int,
+    stacks: dict | None = None,
 ) -> pd.DataFrame:
 
-    # Get initial stack and melt to long for that year
+    if stacks is None:
+        stacks = _load_asset_stacks(importer, start_year=start_year, end_year=end_year)
+
+    # Melt the stacks of all years to long format with one row per asset, parameter and year
     multiindex = ["uuid", "product", "region", "parameter"]
-    df = importer.get_asset_stack(start_year)
-    df = df[
-        [
-            "uuid",
-            "product",
-            "region",
-            "technology",
-            "annual_production_capacity",
-            "annual_production_volume",
-            "retrofit_status",
-            "rebuild_status",
-            "greenfield_status",
-        ]
+    parameters = [
+        "technology",
+        "annual_production_capacity",
+        "annual_production_volume",
+        "retrofit_status",
+        "rebuild_status",
     ]
-    df = df.set_index(["product", "region", "uuid"])
-    df = df.melt(var_name="parameter", value_name=start_year, ignore_index=False)
-    df = df.sort_index()
-    df = df.reset_index(drop=False).set_index(multiindex)
-
-    for year in np.arange(start_year + 1, end_year + 1):
-
-        # Get asset stack for that year
-        df_stack = importer.get_asset_stack(year=year)
-        df_stack = df_stack[
-            [
-                "uuid",
-                "product",
-                "region",
-                "technology",
-                "annual_production_capacity",
-                "annual_production_volume",
-                "retrofit_status",
-                "rebuild_status",
+    df_long = pd.concat(
+        [
+            stacks[year][
+                ["uuid", "product", "region"]
+                + parameters
+                + (["greenfield_status"] if year == start_year else [])
             ]
-        ]
+            .melt(id_vars=["uuid", "product", "region"], var_name="parameter")
+            .assign(year=year)
+            for year in np.arange(start_year, end_year + 1)
+        ],
+        ignore_index=True,
+    )
+    df_long["parameter"] = df_long["parameter"].astype("category")
 
-        # Reformat stack DataFrame
-        df_stack = df_stack.set_index(["product", "region", "uuid"])
-        df_stack = df_stack.melt(
-            var_name="parameter", value_name=year, ignore_index=False
-        )
-        df_stack = df_stack.reset_index().set_index("uuid")
-        df_stack = df_stack.sort_index()
-
-        # Differentiate between existing and new assets
-        previous_uuids = df.index.unique()
-        current_uuids = df_stack.index.unique()
-
-        existing_uuids = [uuid for uuid in current_uuids if uuid in previous_uuids]
-        new_uuids = [uuid for uuid in current_uuids if uuid not in previous_uuids]
-        vanished_uuids = [
-            uuid for uuid in previous_uuids if uuid not in current_uuids
-        ]  # Decommissioned assets (not relevant)
-
-        newbuild_stack = (
-            df_stack[df_stack.index.isin(new_uuids)]
-            .reset_index()
-            .set_index(multiindex)
-            .sort_index()
-        )
-        existing_stack = (
-            df_stack[df_stack.index.isin(existing_uuids)]
-            .reset_index()
-            .set_index(multiindex)
-            .sort_index()
-        )
+    # Initial assets are sorted by product, region and uuid, newbuild assets by year of commissioning and uuid
+    df_first = df_long.drop_duplicates(multiindex)
+    is_initial = df_first["year"] == start_year
+    df_first = pd.concat(
+        [
+            df_first.loc[is_initial].sort_values(
+                ["product", "region", "uuid"], kind="stable"
+            ),
+            df_first.loc[~is_initial].sort_values(["year"] + multiindex),
+        ]
+    )
 
-        # Join existing stack and add newbuild stack
-        df[year] = existing_stack[year]
-        df = pd.concat([df, newbuild_stack])
+    # Reshape to one column per year in a single unstack
+    df = (
+        df_long.set_index(multiindex + ["year"])["value"]
+        .unstack("year")
+        .reindex(pd.MultiIndex.from_frame(df_first[multiindex]))
+        .rename_axis(columns=None)
+    )
 
     return df
 
@@ -401,11 +407,13 @@ def output_technology_roadmap(
     importer: IntermediateDataImporter,
     start_year: int,
     end_year: int,
+    stacks: dict | None = None,
 ):
     df_roadmap = create_technology_roadmap(
         importer=importer,
         start_year=start_year,
         end_year=end_year,
+        stacks=stacks,
     )
     importer.export_data(df_roadmap, "technology_roadmap.csv", "final")
     plot_technology_roadmap(importer=importer, df_roadmap=df_roadmap)
@@ -415,11 +423,13 @@ def output_emissions_trajectory(
     importer: IntermediateDataImporter,
     start_year: int,
     end_year: int,
+    stacks: dict | None = None,
 ):
     df_trajectory = create_emissions_trajectory(
         importer=importer,
         start_year=start_year,
         end_year=end_year,
+        stacks=stacks,
     )
     df_wide = pd.pivot_table(
         df_trajectory, values="value", index="variable", columns="year"
@@ -432,24 +442,39 @@ def create_technology_roadmap(
     importer: IntermediateDataImporter,
     start_year: int,
     end_year: int,
+    stacks: dict | None = None,
 ) -> pd.DataFrame:
     """Create technology roadmap that shows evolution of stack (supply mix) over model horizon."""
 
+    if stacks is None:
+        stacks = _load_asset_stacks(importer, start_year=start_year, end_year=end_year)
+
     # Annual production volume in MtNH3 by technology
     technologies = importer.get_technology_characteristics()["technology"].unique()
-    df_roadmap = pd.DataFrame(data={"technology": technologies})
+    years = np.arange(start_year, end_year + 1)
 
-    for year in np.arange(start_year, end_year + 1):
-
-        # Group by technology and sum annual production volume
-        df_stack = importer.get_asset_stack(year=year)
-        df_sum = df_stack.groupby(["technology"], as_index=False).sum()
-        df_sum = df_sum[["technology", "annual_production_volume"]].rename(
-            {"annual_production_volume": year}, axis=1
-        )
+    # Annual production volume of every asset in every year in long format
+    df_long = pd.concat(
+        [
+            stacks[year][["technology", "annual_production_volume"]].assign(year=year)
+            for year in years
+        ]
+    )
 
-        # Merge with roadmap DataFrame
-        df_roadmap = df_roadmap.merge(df_sum, on=["technology"], how="left").fillna(0)
+    # Sum annual production volume by technology with the years as columns
+    df_sum = (
+        df_long.groupby(["technology", "year"], observed=True)[
+            "annual_production_volume"
+        ]
+        .sum()
+        .unstack("year", fill_value=0)
+        .reindex(columns=years, fill_value=0)
+    )
+    df_roadmap = (
+        pd.DataFrame(data={"technology": technologies})
+        .merge(df_sum.reset_index(), on=["technology"], how="left")
+        .fillna(0)
+    )
 
     # Sort technologies as required
     df_roadmap = df_roadmap.loc[
@@ -476,18 +501,17 @@ def create_technology_roadmap(
         "Biomass Gasification + ammonia synthesis",
         "Waste to ammonia",
     ]
-    tech_order = CategoricalDtype(technologies, ordered=True)
-    df_roadmap["technology"] = df_roadmap["technology"].astype(tech_order)
-
-    df_roadmap = df_roadmap.sort_values(["technology"])
+    # Technologies that are not listed keep their order after the listed ones
+    df_roadmap = df_roadmap.set_index("technology")
+    df_roadmap = df_roadmap.reindex(
+        [tech for tech in technologies if tech in df_roadmap.index]
+        + [tech for tech in df_roadmap.index if tech not in technologies]
+    ).reset_index()
 
     # Take out ammonia synthesis
-    shortened_tech_names = {
-        tech.replace(" + ammonia synthesis", ""): tech
-        for tech in df_roadmap["technology"].unique()
-    }
-    df_roadmap["technology"] = df_roadmap["technology"].astype(str)
-    df_roadmap["technology"] = df_roadmap["technology"].replace(shortened_tech_names)
+    df_roadmap["technology"] = df_roadmap["technology"].str.replace(
+        " + ammonia synthesis", "", regex=False
+    )
 
     return df_roadmap
 
@@ -503,17 +527,25 @@ def plot_technology_roadmap(
     )
 
     fig = make_subplots()
-    wedge_fig = px.area(df_roadmap, color="technology", x="year", y="annual_volume")
-
-    fig.add_traces(wedge_fig.data)
+    for technology, df_tech in df_roadmap.groupby("technology", sort=False):
+        fig.add_trace(
+            go.Scatter(
+                x=df_tech["year"],
+                y=df_tech["annual_volume"],
+                name=technology,
+                mode="lines",
+                stackgroup="one",
+            )
+        )
 
     fig.layout.xaxis.title = "Year"
     fig.layout.yaxis.title = "Annual production volume (MtNH3/year)"
     fig.layout.title = "Technology roadmap"
 
-    plot(
+    pio.write_html(
         fig,
-        filename=str(importer.final_path.joinpath("technology_roadmap.html")),
+        file=str(importer.final_path.joinpath("technology_roadmap.html")),
+        include_plotlyjs="cdn",
         auto_open=False,
     )
 
@@ -522,47 +554,54 @@ def create_emissions_trajectory(
     importer: IntermediateDataImporter,
     start_year: int,
     end_year: int,
+    stacks: dict | None = None,
 ) -> pd.DataFrame:
     """Create emissions trajectory for scope 1, 2, 3 along with demand."""
 
+    if stacks is None:
+        stacks = _load_asset_stacks(importer, start_year=start_year, end_year=end_year)
+
     # Get emissions for each technology
     df_emissions = importer.get_emissions()
-    df_trajectory = pd.DataFrame()
 
     greenhousegases = ["co2", "ch4", "n2o"]
     emission_cols = [
         f"{ghg}_{scope}" for ghg in greenhousegases for scope in EMISSION_SCOPES_DEFAULT
     ] + ["co2_scope1_captured"]
+    cols_to_keep = [f"emissions_{col}" for col in emission_cols]
 
-    for year in np.arange(start_year, end_year + 1):
+    # Merge the emission factors onto the annual production volume of every asset in every year
+    df_stacks = pd.concat(
+        [
+            stacks[year][
+                ["product", "region", "technology", "annual_production_volume"]
+            ].assign(year=year)
+            for year in np.arange(start_year, end_year + 1)
+        ],
+        ignore_index=True,
+    )
+    df_stack_emissions = df_stacks.merge(
+        df_emissions, on=["product", "technology", "region", "year"], how="left"
+    )
 
-        # Filter emissions for the year
-        df_em = df_emissions.loc[df_emissions["year"] == year]
+    # Multiply production volume with emission factors of every asset in one broadcast
+    volumes = df_stack_emissions["annual_production_volume"].to_numpy()
+    emission_factors = df_stack_emissions[emission_cols].to_numpy(dtype=float)
+    df_asset_emissions = pd.DataFrame(
+        volumes[:, np.newaxis] * emission_factors, columns=cols_to_keep
+    )
 
-        # Calculate annual production volume by technology, merge with emissions and sum for each scope
-        df_stack = importer.get_asset_stack(year=year)
-        df_sum = df_stack.groupby(
-            ["product", "region", "technology"], as_index=True
-        ).sum()
-        df_sum = df_sum[["annual_production_volume"]].reset_index()
-        df_stack_emissions = df_sum.merge(
-            df_em, on=["product", "technology", "region"], how="left"
+    # Sum the emissions of each product in every year and melt to long format
+    df_trajectory = (
+        df_asset_emissions.groupby(
+            [df_stack_emissions["year"], df_stack_emissions["product"]], observed=True
         )
+        .sum()
+        .reset_index()
+        .melt(id_vars=["year", "product"])
+    )
 
-        # Multiply production volume with emission factor for each region and technology
-        for col in emission_cols:
-            df_stack_emissions[f"emissions_{col}"] = (
-                df_stack_emissions["annual_production_volume"] * df_stack_emissions[col]
-            )
-
-        # Melt to long format and concatenate
-        cols_to_keep = [f"emissions_{col}" for col in emission_cols]
-        df_total = df_stack_emissions.groupby("product").sum()[cols_to_keep]
-        df_total = df_total.melt()
-        df_total["year"] = year
-        df_trajectory = pd.concat([df_total, df_trajectory], axis=0)
-
-    return df_trajectory
+    return df_trajectory[["variable", "value", "year"]]
 
 
 def plot_emissions_trajectory(
@@ -571,17 +610,24 @@ def plot_emissions_trajectory(
     """Plot emissions trajectory."""
 
     fig = make_subplots()
-    line_fig = px.line(df_trajectory, color="variable", x="year", y="value")
-
-    fig.add_traces(line_fig.data)
+    for variable, df_variable in df_trajectory.groupby("variable", sort=False):
+        fig.add_trace(
+            go.Scatter(
+                x=df_variable["year"],
+                y=df_variable["value"],
+                name=variable,
+                mode="lines",
+            )
+        )
 
     fig.layout.xaxis.title = "Year"
     fig.layout.yaxis.title = "Annual emissions (Mt GHG)"
     fig.layout.title = "Emission trajectory"
 
-    plot(
+    pio.write_html(
         fig,
-        filename=str(importer.final_path.joinpath("emission_trajectory.html")),
+        file=str(importer.final_path.joinpath("emission_trajectory.html")),
+        include_plotlyjs="cdn",
         auto_open=False,
     )
 
@@ -596,21 +642,11 @@ def sort_technologies_by_classification(df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: _description_
     """
 
-    tech_class = get_tech_classification()
-
-    tech_class_inv = {
-        tech: classification
-        for (classification, tech_list) in tech_class.items()
-        for tech in tech_list
-    }
-
     # Add tech classification column and sort
     class_order = CategoricalDtype(
         ["Initial", "Transitional", "End-state"], ordered=True
     )
-    df["tech_class"] = (
-        df["technology"].apply(lambda x: tech_class_inv[x]).astype(class_order)
-    )
+    df["tech_class"] = df["technology"].map(_TECH_CLASS_INV).astype(class_order)
     df = df.sort_values(["tech_class", "technology"])
 
     return df
@@ -645,3 +681,11 @@ def get_tech_classification() -> dict:
             "Oversized ATR + CCS",
         ],
     }
+
+
+# Technology classification of every technology, inverted once at import
+_TECH_CLASS_INV = {
+    tech: classification
+    for (classification, tech_list) in get_tech_classification().items()
+    for tech in tech_list
+}
@@ -355,11 +355,22 @@ def apply_regional_technology_ban(
     if not sector_bans:
         logger.info("No regional technology ban applied")
         return df_technology_switches
-    for region in sector_bans.keys():
-        banned_transitions = (df_technology_switches["region"] == region) & (
-            df_technology_switches["technology_destination"].isin(sector_bans[region])
-        )
-        df_technology_switches = df_technology_switches.loc[~banned_transitions]
+    # Look up all (region, technology_destination) pairs at once instead of filtering region by region
+    pairs = [
+        (region, technology)
+        for region, technologies in sector_bans.items()
+        for technology in technologies
+    ]
+    if not pairs:
+        logger.info("Regional technology ban applied")
+        return df_technology_switches
+    banned_pairs = pd.MultiIndex.from_tuples(
+        pairs, names=["region", "technology_destination"]
+    )
+    banned_transitions = pd.MultiIndex.from_frame(
+        df_technology_switches[["region", "technology_destination"]]
+    ).isin(banned_pairs)
+    df_technology_switches = df_technology_switches.loc[~banned_transitions]
     logger.info("Regional technology ban applied")
     return df_technology_switches
 
@@ -43,6 +43,53 @@ def flatten_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def decategorize_columns(df: pd.DataFrame, cols: list) -> pd.DataFrame:
+    """Cast the categorical columns among cols to object dtype. Grouping by several categorical columns can be
+    orders of magnitude slower than grouping by the same columns as objects.
+
+    Args:
+        df (pd.DataFrame): DataFrame that is going to be grouped
+        cols (list): column headers used as group keys
+
+    Returns:
+        pd.DataFrame: df with the categorical columns among cols cast to object (df itself if there are none)
+    """
+    categorical_cols = [
+        col
+        for col in cols
+        if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype)
+    ]
+    if not categorical_cols:
+        return df
+
+    return df.astype({col: object for col in categorical_cols})
+
+
+def categorize_columns(dfs: dict, cols: list) -> dict:
+    """Cast the columns among cols to categoricals that share the same categories across all DataFrames in dfs. Shared
+    categories keep the columns categorical when the DataFrames are concatenated or merged with each other.
+
+    Args:
+        dfs (dict): DataFrames with the same column headers (e.g., asset stacks by year)
+        cols (list): column headers to be cast, typically string keys with few distinct values
+
+    Returns:
+        dict: dfs with the columns among cols cast to a shared pd.CategoricalDtype
+    """
+    dtypes = {}
+    for col in cols:
+        values = [df[col].dropna().unique() for df in dfs.values() if col in df.columns]
+        if values:
+            dtypes[col] = pd.CategoricalDtype(sorted(set(np.concatenate(values))))
+
+    return {
+        key: df.astype(
+            {col: dtype for col, dtype in dtypes.items() if col in df.columns}
+        )
+        for key, df in dfs.items()
+    }
+
+
 def get_emission_columns(ghgs: list, scopes: list) -> list:
     """Get list of emissions columns for specified GHGs and emission scopes"""
     return [f"{ghg}_{scope}" for scope in scopes for ghg in ghgs]
@@ -1,5 +1,6 @@
 """Utility library for functions used throughout the module"""
 
+import numpy as np
 import pandas as pd
 from mppshared.utility.log_utility import get_logger
 
@@ -63,12 +64,47 @@ def filter_input_metrics(df: pd.DataFrame, list_metrics: list) -> pd.DataFrame:
     Returns:
         df (): Filtered with only the those metrics in list_metrics
     """
-    df_list = []
-    df = df.copy()
-    for metric in list_metrics:
-        df_append = df.loc[df["metric"] == metric, :]
-        df_list.append(df_append)
+    # Look up the position of every row's metric in list_metrics with one hash join instead of comparing the entire
+    #   "metric" column with each metric string, and keep the rows ordered by list_metrics
+    df_rows = pd.DataFrame(
+        {"metric": df["metric"].to_numpy(), "row": np.arange(len(df))}
+    )
+    df_positions = pd.DataFrame(
+        {"metric": list(list_metrics), "position": np.arange(len(list_metrics))}
+    )
+    df_rows = df_rows.merge(df_positions, on="metric").sort_values(["position", "row"])
+    df = df.iloc[df_rows["row"].to_numpy()].reset_index(drop=True)
+
+    return df
 
-    df = pd.concat(df_list).reset_index(drop=True)
+
+def filter_component_metrics(
+    df: pd.DataFrame, components: list, subcomponent: str
+) -> pd.DataFrame:
+    """
+    Takes a dataframe with a "metric" column as well as a list of components (e.g., the CCU/S process cost
+        components) as inputs and outputs a dataframe that only includes the metrics of the given subcomponent of all
+        components. Every item in the list of components is a dict with the names of the subcomponents as keys and lists
+        of metrics as values.
+
+    Args:
+        df (): unindexed df with "metric" column
+        components ():
+        subcomponent (): key of the subcomponent in every component
+
+    Returns:
+        df (): Filtered with only the metrics of subcomponent and with an additional "component" column that holds the
+            position of the respective component in components (rows are repeated for metrics of several components)
+    """
+    # one row per component and metric instead of a lookup in every component dict
+    df_component_metrics = pd.DataFrame(
+        data=[
+            (i, metric)
+            for i, component in enumerate(components)
+            for metric in component[subcomponent]
+        ],
+        columns=["component", "metric"],
+    )
+    df = df.merge(df_component_metrics, on="metric")
 
     return df
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+import pandas as pd
+from mppshared.agent_logic.agent_logic_functions import (
+    group_assets_by_transition_origin,
+    sort_assets_cost_metric,
+)
+from mppshared.models.asset import Asset
+
+
+def _make_asset(region: str, technology: str) -> Asset:
+    return Asset(
+        product="Aluminium",
+        technology=technology,
+        region=region,
+        year_commissioned=2010,
+        annual_production_capacity=1.0,
+        cuf=0.8,
+        asset_lifetime=40,
+        technology_classification="initial",
+        emission_scopes=["scope1"],
+        cuf_lower_threshold=0.5,
+        ghgs=["co2"],
+    )
+
+
+def test_group_assets_by_transition_origin():
+    assets = [
+        _make_asset("US", "Prebake"),
+        _make_asset("Africa", "Prebake"),
+        _make_asset("US", "Prebake"),
+    ]
+    groups = group_assets_by_transition_origin(assets)
+    assert groups[("Prebake", "US", "Aluminium")] == [assets[0], assets[2]]
+    assert groups[("Prebake", "Africa", "Aluminium")] == [assets[1]]
+    assert ("Soderberg", "US", "Aluminium") not in groups
+
+
+def test_sort_assets_cost_metric():
+    df_cost = pd.DataFrame(
+        {
+            "product": "Aluminium",
+            "technology_origin": ["New-build", "New-build", "New-build", "Prebake"],
+            "year": 2020,
+            "region": ["US", "US", "Africa", "US"],
+            "technology_destination": ["Prebake", "Soderberg", "Prebake", "Prebake"],
+            "lcox": [2.0, 3.0, 1.0, 0.0],
+        }
+    )
+    assets = [
+        _make_asset("US", "Soderberg"),
+        _make_asset("US", "Prebake"),
+        _make_asset("Africa", "Prebake"),
+        _make_asset("US", "Prebake"),
+    ]
+    pathway = SimpleNamespace(df_cost=df_cost)
+
+    ascending = sort_assets_cost_metric(assets, pathway, 2020, "lcox")
+    assert ascending == [assets[2], assets[1], assets[3], assets[0]]
+
+    descending = sort_assets_cost_metric(assets, pathway, 2020, "lcox", descending=True)
+    assert descending == [assets[0], assets[1], assets[3], assets[2]]
+
+    assert sort_assets_cost_metric([], pathway, 2020, "lcox") == []
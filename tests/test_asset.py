@@ -0,0 +1,159 @@
+from types import SimpleNamespace
+
+import pandas as pd
+from mppshared.agent_logic.agent_logic_functions import (
+    decrease_cuf_of_assets,
+    increase_cuf_of_assets,
+)
+from mppshared.models.asset import UPDATED_ASSET_ATTRIBUTES, Asset, AssetStack
+
+
+def _make_asset(region: str, technology: str, cuf: float = 0.8) -> Asset:
+    return Asset(
+        product="Ammonia",
+        technology=technology,
+        region=region,
+        year_commissioned=2010,
+        annual_production_capacity=1.0,
+        cuf=cuf,
+        asset_lifetime=40,
+        technology_classification="initial",
+        emission_scopes=["scope1"],
+        cuf_lower_threshold=0.5,
+        ghgs=["co2"],
+    )
+
+
+def _make_stack(assets: list) -> AssetStack:
+    return AssetStack(
+        assets=assets,
+        emission_scopes=["scope1"],
+        ghgs=["co2"],
+        cuf_lower_threshold=0.5,
+    )
+
+
+def test_revert_asset_update():
+    assets = [
+        _make_asset("US", "Natural Gas SMR"),
+        _make_asset("China", "Coal Gasification", cuf=0.6),
+        _make_asset("India", "Natural Gas SMR", cuf=0.9),
+    ]
+    stack = _make_stack(assets)
+
+    for position in [0, 1, 2]:
+        # compute the production totals such that the update has to reset them
+        stack.get_annual_production_volume("Ammonia")
+        uuids_before = [asset.uuid for asset in stack.assets]
+        production_totals_before = dict(stack.production_totals)
+        asset = stack.assets[position]
+        attributes_before = {
+            attribute: getattr(asset, attribute)
+            for attribute in UPDATED_ASSET_ATTRIBUTES
+        }
+
+        undo = stack.update_asset(
+            year=2030,
+            asset_to_update=asset,
+            new_technology="Electrolysis - grid PPA",
+            new_classification="end-state",
+            asset_lifetime=30,
+            switch_type="brownfield_newbuild",
+            origin_technology=asset.technology,
+            update_year_commission=True,
+        )
+        assert stack.assets[-1] is asset
+        assert asset.technology == "Electrolysis - grid PPA"
+        assert asset.rebuild and asset.year_commissioned == 2030
+        assert stack.production_totals is None
+
+        stack.revert_asset_update(undo)
+        assert [asset.uuid for asset in stack.assets] == uuids_before
+        assert {
+            attribute: getattr(asset, attribute)
+            for attribute in UPDATED_ASSET_ATTRIBUTES
+        } == attributes_before
+        assert stack.production_totals == production_totals_before
+
+
+def _assert_production_totals(stack: AssetStack):
+    for product in ["Ammonia", "Urea"]:
+        assets = [asset for asset in stack.assets if asset.product == product]
+        assert stack.get_annual_production_capacity(product) == sum(
+            asset.annual_production_capacity for asset in assets
+        )
+        assert stack.get_annual_production_volume(product) == sum(
+            asset.annual_production_capacity * asset.cuf for asset in assets
+        )
+
+
+def test_production_totals():
+    assets = [
+        _make_asset("US", "Natural Gas SMR", cuf=0.6),
+        _make_asset("China", "Coal Gasification", cuf=0.7),
+    ]
+    stack = _make_stack(assets)
+    df_cost = pd.DataFrame(
+        {
+            "product": "Ammonia",
+            "technology_origin": "New-build",
+            "year": 2030,
+            "region": ["US", "China", "India", "US"],
+            "technology_destination": [
+                "Natural Gas SMR",
+                "Coal Gasification",
+                "Natural Gas SMR",
+                "Natural Gas SMR + CCS",
+            ],
+            "lcox": [1.0, 2.0, 3.0, 1.5],
+        }
+    )
+    pathway = SimpleNamespace(df_cost=df_cost, get_stack=lambda year: stack)
+    _assert_production_totals(stack)
+
+    # appended assets are added to the totals
+    new_asset = _make_asset("India", "Natural Gas SMR", cuf=0.9)
+    stack.append(new_asset)
+    _assert_production_totals(stack)
+    urea_asset = _make_asset("US", "Natural Gas SMR")
+    urea_asset.product = "Urea"
+    stack.append(urea_asset)
+    _assert_production_totals(stack)
+
+    # updated assets move to the end of the stack
+    stack.update_asset(
+        year=2030,
+        asset_to_update=assets[0],
+        new_technology="Natural Gas SMR + CCS",
+        new_classification="transition",
+        asset_lifetime=30,
+        switch_type="brownfield_renovation",
+        origin_technology="Natural Gas SMR",
+        update_year_commission=False,
+    )
+    _assert_production_totals(stack)
+
+    # CUF changes of the assets in the stack
+    increase_cuf_of_assets(
+        pathway=pathway,
+        demand=10.0,
+        product="Ammonia",
+        year=2030,
+        cost_metric="lcox",
+        cuf_upper_threshold=0.95,
+    )
+    _assert_production_totals(stack)
+    decrease_cuf_of_assets(
+        pathway=pathway,
+        demand=0.0,
+        product="Ammonia",
+        year=2030,
+        cost_metric="lcox",
+        cuf_lower_threshold=0.5,
+    )
+    _assert_production_totals(stack)
+
+    stack.remove(new_asset)
+    _assert_production_totals(stack)
+    stack.append(_make_asset("US", "Natural Gas SMR", cuf=0.3))
+    _assert_production_totals(stack)
@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+from mppshared.calculate.calculate_cost import calculate_npv_costs, discount_costs
+
+
+def test_discount_costs():
+    grouping_cols = ["product", "technology_destination"]
+    df_cost = pd.DataFrame(
+        {
+            "product": "Ammonia",
+            "technology_destination": np.repeat(["Electrolysis", "SMR"], 5),
+            "year": np.tile(np.arange(2020, 2025), 2),
+            "carbon_cost_addition": np.arange(10, dtype=float),
+            "technology_lifetime": np.repeat([2.0, 10.0], 5),
+            "wacc": np.repeat([0.0, 0.1], 5),
+        }
+    )
+    df_expected = df_cost.groupby(grouping_cols).apply(calculate_npv_costs)
+
+    df_npv = discount_costs(df_cost, grouping_cols)
+    pd.testing.assert_frame_equal(df_npv.sort_index(), df_expected.sort_index())
+
+    # Without lifetime beyond the model years and without discounting, the NPV is the sum over the lifetime
+    assert df_npv.loc[("Ammonia", "Electrolysis", 2020), "carbon_cost_addition"] == 3
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+from mppshared.models.carbon_cost_trajectory import CarbonCostTrajectory
+
+
+def test_get_carbon_cost():
+    carbon_cost_trajectory = CarbonCostTrajectory(
+        trajectory="linear",
+        initial_carbon_cost=0,
+        final_carbon_cost=100,
+        start_year=2025,
+        end_year=2030,
+        model_years=np.arange(2020, 2051),
+    )
+    assert carbon_cost_trajectory.get_carbon_cost(2020) == 0
+    assert carbon_cost_trajectory.get_carbon_cost(2027) == 40
+    assert carbon_cost_trajectory.get_carbon_cost(2050) == 100
+    assert carbon_cost_trajectory.final_carbon_cost == 100
+
+    # years outside of the model years are not part of the trajectory
+    for year in [2019, 2051]:
+        with pytest.raises(KeyError):
+            carbon_cost_trajectory.get_carbon_cost(year)
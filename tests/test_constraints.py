@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+from mppshared.models.constraints import is_constraint_affected_by_technology
+
+
+def _make_pathway() -> SimpleNamespace:
+    df_emissions = pd.DataFrame(
+        {
+            "product": "Ammonia",
+            "region": "US",
+            "year": [2030, 2030, 2030, 2031],
+            "technology": [
+                "Natural Gas SMR",
+                "Natural Gas SMR + CCS",
+                "Coal Gasification + CCS",
+                "Coal Gasification + CCS",
+            ],
+            "co2_scope1_captured": [0.0, 1.5, np.nan, 0.8],
+        }
+    ).set_index(["product", "region", "year", "technology"])
+    return SimpleNamespace(
+        technologies_maximum_global_demand_share=["Biomass Digestion + HB"],
+        emissions=df_emissions,
+    )
+
+
+def test_is_constraint_affected_by_technology():
+    pathway = _make_pathway()
+
+    constraint = "electrolysis_capacity_addition_constraint"
+    assert is_constraint_affected_by_technology(
+        pathway, constraint, "Electrolyser + SMR + ammonia synthesis"
+    )
+    assert not is_constraint_affected_by_technology(
+        pathway, constraint, "Natural Gas SMR + CCS"
+    )
+
+    constraint = "demand_share_constraint"
+    assert is_constraint_affected_by_technology(
+        pathway, constraint, "Biomass Digestion + HB"
+    )
+    assert not is_constraint_affected_by_technology(
+        pathway, constraint, "Natural Gas SMR"
+    )
+
+    constraint = "co2_storage_constraint"
+    assert is_constraint_affected_by_technology(
+        pathway, constraint, "Natural Gas SMR + CCS"
+    )
+    # captures CO2 only in some years
+    assert is_constraint_affected_by_technology(
+        pathway, constraint, "Coal Gasification + CCS"
+    )
+    assert not is_constraint_affected_by_technology(
+        pathway, constraint, "Natural Gas SMR"
+    )
+    assert not is_constraint_affected_by_technology(
+        pathway, constraint, "Electrolyser - grid PPA"
+    )
+
+    # constraints that depend on all technologies
+    for constraint in ["emissions_constraint", "rampup_constraint"]:
+        assert is_constraint_affected_by_technology(
+            pathway, constraint, "Natural Gas SMR"
+        )
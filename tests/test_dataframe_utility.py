@@ -0,0 +1,38 @@
+import pandas as pd
+from mppshared.utility.dataframe_utility import (
+    categorize_columns,
+    decategorize_columns,
+)
+
+
+def test_decategorize_columns():
+    df = pd.DataFrame(
+        {
+            "product": pd.Categorical(["Aluminium", "Aluminium"]),
+            "region": pd.Categorical(["US", "Africa"]),
+            "value": [1.0, 2.0],
+        }
+    )
+    df_decategorized = decategorize_columns(df, ["product", "technology"])
+    assert df_decategorized["product"].dtype == object
+    assert isinstance(df_decategorized["region"].dtype, pd.CategoricalDtype)
+    assert decategorize_columns(df_decategorized, ["product"]) is df_decategorized
+
+
+def test_categorize_columns():
+    dfs = {
+        2020: pd.DataFrame({"region": ["US", "Africa"], "value": [1.0, 2.0]}),
+        2021: pd.DataFrame({"region": ["Russia", "US"], "value": [3.0, 4.0]}),
+    }
+    dfs_categorized = categorize_columns(dfs, ["region", "technology"])
+    assert (
+        dfs_categorized[2020]["region"].dtype == dfs_categorized[2021]["region"].dtype
+    )
+    assert list(dfs_categorized[2021]["region"].cat.categories) == [
+        "Africa",
+        "Russia",
+        "US",
+    ]
+    df = pd.concat(dfs_categorized.values())
+    assert isinstance(df["region"].dtype, pd.CategoricalDtype)
+    assert list(df["region"]) == ["US", "Africa", "Russia", "US"]
@@ -1,6 +1,7 @@
 import pandas as pd
 from mppshared.solver.implicit_forcing import (
     add_technology_classification_to_switching_table,
+    apply_regional_technology_ban,
     apply_technology_availability_constraint,
     apply_technology_moratorium,
 )
@@ -74,3 +75,21 @@ def test_apply_technology_moratorium():
         ].max()
         <= 2040
     )
+
+
+def test_apply_regional_technology_ban():
+    df_switching_table = pd.DataFrame(
+        {
+            "region": ["China", "China", "US"],
+            "technology_origin": "Prebake",
+            "technology_destination": ["Soderberg", "Prebake", "Soderberg"],
+        }
+    )
+    df_technologies = apply_regional_technology_ban(
+        df_switching_table, {"China": ["Soderberg"]}
+    )
+    assert df_technologies.index.tolist() == [1, 2]
+
+    for sector_bans in [{}, {"China": []}]:
+        df_technologies = apply_regional_technology_ban(df_switching_table, sector_bans)
+        pd.testing.assert_frame_equal(df_technologies, df_switching_table)
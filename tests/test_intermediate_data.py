@@ -0,0 +1,56 @@
+import multiprocessing as mp
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from mppshared.import_data import intermediate_data
+from mppshared.import_data.intermediate_data import (
+    _open_workbook,
+    close_business_case_workbooks,
+)
+
+
+def _parse_sheet(workbook_key: tuple, sheet_name: str) -> tuple:
+    workbook = intermediate_data._business_case_workbooks.get(workbook_key)
+    if workbook is None:
+        workbook = _open_workbook(workbook_key[0])
+    return (
+        len(intermediate_data._business_case_workbooks),
+        workbook.parse(sheet_name).shape,
+    )
+
+
+def _write_workbook(path) -> list:
+    sheet_names = [f"sheet_{i}" for i in range(4)]
+    with pd.ExcelWriter(path) as writer:
+        for sheet_name in sheet_names:
+            pd.DataFrame(np.random.rand(1000, 10)).to_excel(
+                writer, sheet_name=sheet_name, index=False
+            )
+    return sheet_names
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="forks worker processes")
+def test_forked_workers_open_business_case_workbooks(tmp_path):
+    sheet_names = _write_workbook(tmp_path.joinpath("business_cases.xlsx"))
+    workbook_key = (tmp_path.joinpath("business_cases.xlsx"), None)
+    intermediate_data._business_case_workbooks[workbook_key] = _open_workbook(
+        workbook_key[0]
+    )
+    try:
+        with ProcessPoolExecutor(
+            max_workers=len(sheet_names), mp_context=mp.get_context("fork")
+        ) as executor:
+            results = list(
+                executor.map(
+                    _parse_sheet, [workbook_key] * len(sheet_names), sheet_names
+                )
+            )
+        # the workers do not inherit the workbook opened by the parent process
+        assert results == [(0, (1000, 10))] * len(sheet_names)
+        assert workbook_key in intermediate_data._business_case_workbooks
+    finally:
+        close_business_case_workbooks()
+    assert not intermediate_data._business_case_workbooks
@@ -0,0 +1,34 @@
+import pandas as pd
+from mppshared.models.ranking_table import RankingTable
+
+
+def test_ranking_table():
+    df_rank = pd.DataFrame(
+        {
+            "technology_origin": ["Coal", "Coal", "Gas", "Electrolysis"],
+            "technology_destination": [
+                "Gas",
+                "Electrolysis",
+                "Electrolysis",
+                "Electrolysis",
+            ],
+            "rank": [1, 2, 3, 4],
+        }
+    )
+    ranking = RankingTable(df_rank)
+
+    index, transition = ranking.select_best_transition()
+    assert index == 0
+    assert transition == {
+        "technology_origin": "Coal",
+        "technology_destination": "Gas",
+        "rank": 1,
+    }
+
+    ranking.remove_transition(index)
+    ranking.remove_all_transitions_with_destination_technology("Electrolysis")
+    index, transition = ranking.select_best_transition()
+    assert transition["technology_origin"] == "Electrolysis"
+
+    ranking.remove_transition(index)
+    assert ranking.empty()